@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from setuptools import find_packages, setup
+from setuptools import setup
 
 # Read README for long description
 readme_file = Path(__file__).parent.parent.parent / "README.md"
@@ -19,28 +19,34 @@ setup(
     author="Bryan Stevens Acosta",
     author_email="bryanstevensacosta@gmail.com",
     url="https://github.com/bryanstevensacosta/tts-studio",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    # Package discovery is configured statically in pyproject.toml
+    # ([tool.setuptools.packages.find]) so the walk prunes non-package dirs.
     python_requires=">=3.10,<3.12",
     install_requires=[
-        # TTS Engine
-        "qwen-tts>=0.0.5",
-        "torch>=2.0.0",
-        "torchaudio>=2.0.0",
-        # Audio Processing
-        "soundfile>=0.12.0",
         "numpy>=1.24.0",
-        "librosa>=0.10.0",
-        "pydub>=0.25.0",
-        "scipy>=1.10.0",
         # Configuration & Utilities
         "python-dotenv>=1.0.0",
         "PyYAML>=6.0",
         # DTOs and Data Validation
         "pydantic>=2.0.0",
+        "msgspec>=0.18.0",
     ],
     extras_require={
+        # TTS Engine (needed for audio generation)
+        "tts": [
+            "qwen-tts>=0.0.5",
+            "torch>=2.0.0",
+            "torchaudio>=2.0.0",
+        ],
+        # Audio Processing (needed for sample validation and profile creation)
+        "audio": [
+            "soundfile>=0.12.0",
+            "librosa>=0.10.0",
+            "pydub>=0.25.0",
+            "scipy>=1.10.0",
+        ],
         "dev": [
+            "tts-studio[tts,audio]",
             "black>=23.0.0",
             "ruff>=0.1.0",
             "mypy>=1.0.0",
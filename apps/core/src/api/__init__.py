@@ -4,6 +4,18 @@ This layer wires together all the hexagonal architecture components
 and provides a clean, simple API for external consumers (Tauri backend).
 """
 
-from .studio import TTSStudio
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["TTSStudio"]
+if TYPE_CHECKING:
+    from .studio import TTSStudio, get_studio
+
+__all__ = ["TTSStudio", "get_studio"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exports on first access so `import api` stays cheap (PEP 562)."""
+    if name in __all__:
+        from . import studio
+
+        return getattr(studio, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,24 +5,78 @@ of the hexagonal architecture and exposes a simple interface for external
 consumers (primarily the Tauri desktop backend).
 """
 
+import functools
 import logging
 from pathlib import Path
-from typing import Any
-
-from app.dto.generation_dto import GenerationRequestDTO
-from app.use_cases.create_voice_profile import CreateVoiceProfileUseCase
-from app.use_cases.generate_audio import GenerateAudioUseCase
-from app.use_cases.list_voice_profiles import ListVoiceProfilesUseCase
-from app.use_cases.process_batch import ProcessBatchUseCase
-from app.use_cases.validate_audio_samples import ValidateAudioSamplesUseCase
+from typing import TYPE_CHECKING, Any
+
 from domain.ports.config_provider import ConfigProvider
-from infra.audio.processor_adapter import LibrosaAudioProcessor
-from infra.config.yaml_config import YAMLConfigProvider
-from infra.engines.qwen3.adapter import Qwen3Adapter
-from infra.persistence.file_profile_repository import FileProfileRepository
+from domain.ports.tts_engine import TTSEngine
+
+if TYPE_CHECKING:
+    from app.use_cases.generate_audio import GenerateAudioUseCase
+    from app.use_cases.process_batch import ProcessBatchUseCase
 
 logger = logging.getLogger(__name__)
 
+# Default config directory (apps/core/config), resolved once at import
+_CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+
+# Error response templates, copied per call instead of rebuilt as literals
+_CREATE_PROFILE_ERROR: dict[str, Any] = {
+    "status": "error",
+    "profile": None,
+    "error": None,
+}
+_GENERATE_ERROR: dict[str, Any] = {
+    "status": "error",
+    "output_path": None,
+    "duration": None,
+    "generation_time": None,
+    "error": None,
+}
+_LIST_PROFILES_ERROR: dict[str, Any] = {
+    "status": "error",
+    "profiles": None,
+    "count": 0,
+    "error": None,
+}
+_DELETE_PROFILE_ERROR: dict[str, Any] = {
+    "status": "error",
+    "deleted": False,
+    "error": None,
+}
+_VALIDATE_ERROR: dict[str, Any] = {
+    "status": "error",
+    "results": None,
+    "all_valid": False,
+    "error": None,
+}
+_RELOAD_ERROR: dict[str, Any] = {
+    "status": "error",
+    "error": None,
+}
+
+
+def _error_response(
+    template: dict[str, Any], error: str | None, **fields: Any
+) -> dict[str, Any]:
+    """Build an error response from a template.
+
+    Args:
+        template: Module-level error response template
+        error: Error message
+        **fields: Per-call values (e.g. fresh mutable containers)
+
+    Returns:
+        New response dictionary
+    """
+    response = template.copy()
+    if fields:
+        response.update(fields)
+    response["error"] = error
+    return response
+
 
 class TTSStudio:
     """Main API for TTS Studio core library.
@@ -84,22 +138,28 @@ class TTSStudio:
             logger.debug("Configuration loaded from dictionary")
             return
 
-        # Default config paths (relative to apps/core/)
-        default_config = Path(__file__).parent.parent.parent / "config" / "default.yaml"
-        user_config = Path(__file__).parent.parent.parent / "config" / "config.yaml"
+        from infra.config.yaml_config import YAMLConfigProvider
 
-        if config_path:
-            user_config = config_path
+        # Default config paths (relative to apps/core/)
+        default_config = _CONFIG_DIR / "default.yaml"
+        user_config = config_path or _CONFIG_DIR / "config.yaml"
 
         self._config = YAMLConfigProvider(
             default_config_path=default_config,
             user_config_path=user_config if user_config.exists() else None,
         )
 
-        logger.debug(f"Configuration loaded from {default_config}")
+        logger.debug("Configuration loaded from %s", default_config)
 
     def _init_adapters(self) -> None:
-        """Initialize infrastructure adapters (ports implementations)."""
+        """Initialize infrastructure adapters (ports implementations).
+
+        Adapter modules are imported here rather than at module level so that
+        importing the API does not pull in torch/librosa until a studio is built.
+        """
+        from infra.audio.processor_adapter import LibrosaAudioProcessor
+        from infra.persistence.file_profile_repository import FileProfileRepository
+
         # Audio processor adapter
         sample_rate = self._config.get("audio.sample_rate", 12000)
         self._audio_processor = LibrosaAudioProcessor(sample_rate=sample_rate)
@@ -108,10 +168,10 @@ class TTSStudio:
         # Profile repository adapter
         profiles_dir = Path(self._config.get("paths.profiles", "./data/profiles"))
         self._profile_repository = FileProfileRepository(profiles_dir=profiles_dir)
-        logger.debug(f"Profile repository initialized at {profiles_dir}")
+        logger.debug("Profile repository initialized at %s", profiles_dir)
 
-        # TTS engine adapter
-        engine_config = {
+        # TTS engine adapter (built on first use, see _tts_engine)
+        self._engine_config = {
             "model_name": self._config.get(
                 "model.name", "Qwen/Qwen3-TTS-12Hz-1.7B-Base"
             ),
@@ -119,23 +179,20 @@ class TTSStudio:
             "dtype": self._config.get("model.dtype", "float32"),
             "cache_dir": self._config.get("paths.models_cache", "./data/models"),
         }
-        self._tts_engine = Qwen3Adapter(config=engine_config)
-        logger.debug("TTS engine adapter initialized")
+        self._tts_engine_instance: TTSEngine | None = None
 
     def _init_use_cases(self) -> None:
         """Initialize application use cases."""
+        from app.use_cases.create_voice_profile import CreateVoiceProfileUseCase
+        from app.use_cases.list_voice_profiles import ListVoiceProfilesUseCase
+        from app.use_cases.validate_audio_samples import ValidateAudioSamplesUseCase
+
         # Create voice profile use case
         self._create_profile_uc = CreateVoiceProfileUseCase(
             audio_processor=self._audio_processor,
             profile_repository=self._profile_repository,
         )
 
-        # Generate audio use case
-        self._generate_audio_uc = GenerateAudioUseCase(
-            tts_engine=self._tts_engine,
-            profile_repository=self._profile_repository,
-        )
-
         # List profiles use case
         self._list_profiles_uc = ListVoiceProfilesUseCase(
             profile_repository=self._profile_repository,
@@ -146,14 +203,50 @@ class TTSStudio:
             audio_processor=self._audio_processor,
         )
 
-        # Process batch use case
-        self._process_batch_uc = ProcessBatchUseCase(
-            tts_engine=self._tts_engine,
-            profile_repository=self._profile_repository,
-        )
+        # Engine-backed use cases are built lazily with the engine
+        self._generate_audio_uc_instance: GenerateAudioUseCase | None = None
+        self._process_batch_uc_instance: ProcessBatchUseCase | None = None
 
         logger.debug("Use cases initialized")
 
+    @property
+    def _tts_engine(self) -> TTSEngine:
+        """TTS engine adapter, created on first access.
+
+        Building the Qwen3 adapter imports torch and prepares the model loader,
+        so it is deferred until a generation workflow actually needs it.
+        """
+        if self._tts_engine_instance is None:
+            from infra.engines.qwen3.adapter import Qwen3Adapter
+
+            self._tts_engine_instance = Qwen3Adapter(config=self._engine_config)
+            logger.debug("TTS engine adapter initialized")
+        return self._tts_engine_instance
+
+    @property
+    def _generate_audio_uc(self) -> "GenerateAudioUseCase":
+        """Generate audio use case, created on first access."""
+        if self._generate_audio_uc_instance is None:
+            from app.use_cases.generate_audio import GenerateAudioUseCase
+
+            self._generate_audio_uc_instance = GenerateAudioUseCase(
+                tts_engine=self._tts_engine,
+                profile_repository=self._profile_repository,
+            )
+        return self._generate_audio_uc_instance
+
+    @property
+    def _process_batch_uc(self) -> "ProcessBatchUseCase":
+        """Process batch use case, created on first access."""
+        if self._process_batch_uc_instance is None:
+            from app.use_cases.process_batch import ProcessBatchUseCase
+
+            self._process_batch_uc_instance = ProcessBatchUseCase(
+                tts_engine=self._tts_engine,
+                profile_repository=self._profile_repository,
+            )
+        return self._process_batch_uc_instance
+
     def create_voice_profile(
         self,
         name: str,
@@ -178,7 +271,7 @@ class TTSStudio:
             }
         """
         try:
-            logger.info(f"Creating voice profile: {name}")
+            logger.info("Creating voice profile: %s", name)
 
             # Convert string paths to Path objects
             paths = [Path(p) for p in sample_paths]
@@ -191,7 +284,7 @@ class TTSStudio:
                 reference_text=reference_text,
             )
 
-            logger.info(f"Voice profile created successfully: {profile_dto.id}")
+            logger.info("Voice profile created successfully: %s", profile_dto.id)
 
             return {
                 "status": "success",
@@ -200,12 +293,8 @@ class TTSStudio:
             }
 
         except Exception as e:
-            logger.error(f"Failed to create voice profile: {e}", exc_info=True)
-            return {
-                "status": "error",
-                "profile": None,
-                "error": str(e),
-            }
+            logger.error("Failed to create voice profile: %s", e, exc_info=True)
+            return _error_response(_CREATE_PROFILE_ERROR, str(e))
 
     def generate_audio(
         self,
@@ -238,8 +327,10 @@ class TTSStudio:
                 "error": str | None
             }
         """
+        from app.dto.generation_dto import GenerationRequestDTO
+
         try:
-            logger.info(f"Generating audio for profile: {profile_id}")
+            logger.info("Generating audio for profile: %s", profile_id)
 
             # Create generation request
             request = GenerationRequestDTO(
@@ -256,7 +347,7 @@ class TTSStudio:
             result = self._generate_audio_uc.execute(request)
 
             if result.success:
-                logger.info(f"Audio generated successfully: {result.output_path}")
+                logger.info("Audio generated successfully: %s", result.output_path)
                 return {
                     "status": "success",
                     "output_path": (
@@ -267,24 +358,12 @@ class TTSStudio:
                     "error": None,
                 }
             else:
-                logger.error(f"Audio generation failed: {result.error}")
-                return {
-                    "status": "error",
-                    "output_path": None,
-                    "duration": None,
-                    "generation_time": None,
-                    "error": result.error,
-                }
+                logger.error("Audio generation failed: %s", result.error)
+                return _error_response(_GENERATE_ERROR, result.error)
 
         except Exception as e:
-            logger.error(f"Failed to generate audio: {e}", exc_info=True)
-            return {
-                "status": "error",
-                "output_path": None,
-                "duration": None,
-                "generation_time": None,
-                "error": str(e),
-            }
+            logger.error("Failed to generate audio: %s", e, exc_info=True)
+            return _error_response(_GENERATE_ERROR, str(e))
 
     def list_voice_profiles(self) -> dict[str, Any]:
         """List all available voice profiles.
@@ -301,26 +380,21 @@ class TTSStudio:
         try:
             logger.info("Listing voice profiles")
 
-            # Execute use case
-            profiles = self._list_profiles_uc.execute()
+            # Serialize DTOs as they are produced
+            profiles = [p.to_dict() for p in self._list_profiles_uc.iter()]
 
-            logger.info(f"Found {len(profiles)} voice profiles")
+            logger.info("Found %d voice profiles", len(profiles))
 
             return {
                 "status": "success",
-                "profiles": [p.to_dict() for p in profiles],
+                "profiles": profiles,
                 "count": len(profiles),
                 "error": None,
             }
 
         except Exception as e:
-            logger.error(f"Failed to list profiles: {e}", exc_info=True)
-            return {
-                "status": "error",
-                "profiles": None,
-                "count": 0,
-                "error": str(e),
-            }
+            logger.error("Failed to list profiles: %s", e, exc_info=True)
+            return _error_response(_LIST_PROFILES_ERROR, str(e))
 
     def delete_voice_profile(self, profile_id: str) -> dict[str, Any]:
         """Delete a voice profile.
@@ -337,33 +411,27 @@ class TTSStudio:
             }
         """
         try:
-            logger.info(f"Deleting voice profile: {profile_id}")
+            logger.info("Deleting voice profile: %s", profile_id)
 
             # Delete profile
             deleted = self._profile_repository.delete(profile_id)
 
             if deleted:
-                logger.info(f"Profile deleted successfully: {profile_id}")
+                logger.info("Profile deleted successfully: %s", profile_id)
                 return {
                     "status": "success",
                     "deleted": True,
                     "error": None,
                 }
             else:
-                logger.warning(f"Profile not found: {profile_id}")
-                return {
-                    "status": "error",
-                    "deleted": False,
-                    "error": f"Profile not found: {profile_id}",
-                }
+                logger.warning("Profile not found: %s", profile_id)
+                return _error_response(
+                    _DELETE_PROFILE_ERROR, f"Profile not found: {profile_id}"
+                )
 
         except Exception as e:
-            logger.error(f"Failed to delete profile: {e}", exc_info=True)
-            return {
-                "status": "error",
-                "deleted": False,
-                "error": str(e),
-            }
+            logger.error("Failed to delete profile: %s", e, exc_info=True)
+            return _error_response(_DELETE_PROFILE_ERROR, str(e))
 
     def validate_samples(self, sample_paths: list[str]) -> dict[str, Any]:
         """Validate audio samples for voice cloning.
@@ -381,7 +449,7 @@ class TTSStudio:
             }
         """
         try:
-            logger.info(f"Validating {len(sample_paths)} audio samples")
+            logger.info("Validating %d audio samples", len(sample_paths))
 
             # Convert string paths to Path objects
             paths = [Path(p) for p in sample_paths]
@@ -390,20 +458,9 @@ class TTSStudio:
             summary = self._validate_samples_uc.execute(paths)
 
             # Convert results to dict format
-            results_dict = [
-                {
-                    "path": str(r.path),
-                    "valid": r.valid,
-                    "error": r.error,
-                    "duration": r.duration,
-                    "sample_rate": r.sample_rate,
-                    "channels": r.channels,
-                    "bit_depth": r.bit_depth,
-                }
-                for r in summary.results
-            ]
+            results_dict = [r.to_dict() for r in summary.results]
 
-            logger.info(f"Validation complete: {summary.all_valid}")
+            logger.info("Validation complete: %s", summary.all_valid)
 
             return {
                 "status": "success",
@@ -417,13 +474,8 @@ class TTSStudio:
             }
 
         except Exception as e:
-            logger.error(f"Failed to validate samples: {e}", exc_info=True)
-            return {
-                "status": "error",
-                "results": [],
-                "all_valid": False,
-                "error": str(e),
-            }
+            logger.error("Failed to validate samples: %s", e, exc_info=True)
+            return _error_response(_VALIDATE_ERROR, str(e), results=[])
 
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
@@ -458,8 +510,27 @@ class TTSStudio:
             }
 
         except Exception as e:
-            logger.error(f"Failed to reload config: {e}", exc_info=True)
-            return {
-                "status": "error",
-                "error": str(e),
-            }
+            logger.error("Failed to reload config: %s", e, exc_info=True)
+            return _error_response(_RELOAD_ERROR, str(e))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_studio(config_path: str | None) -> TTSStudio:
+    """Build a TTSStudio for a config path string (memoized by get_studio)."""
+    return TTSStudio(config_path=Path(config_path) if config_path else None)
+
+
+def get_studio(config_path: Path | str | None = None) -> TTSStudio:
+    """Get a shared TTSStudio instance for a config file.
+
+    Repeated calls with the same config path return the same instance, so
+    configuration parsing and model loading happen once per process.
+    Dict-based configs (tests) should construct TTSStudio directly.
+
+    Args:
+        config_path: Optional path to config file. If None, uses default config.
+
+    Returns:
+        Shared TTSStudio instance
+    """
+    return _cached_studio(str(config_path) if config_path else None)
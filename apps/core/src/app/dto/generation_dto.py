@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationRequestDTO:
     """Data Transfer Object for audio generation request.
 
@@ -67,7 +67,7 @@ class GenerationRequestDTO:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResultDTO:
     """Data Transfer Object for audio generation result.
 
@@ -8,10 +8,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from domain.models.audio_sample import AudioSample
 from domain.models.voice_profile import VoiceProfile
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceProfileDTO:
     """Data Transfer Object for VoiceProfile.
 
@@ -37,24 +38,31 @@ class VoiceProfileDTO:
         Returns:
             VoiceProfileDTO instance
         """
-        # Convert AudioSample objects to dictionaries
-        samples = [
-            {
-                "path": str(sample.path),
-                "duration": sample.duration,
-                "sample_rate": sample.sample_rate,
-                "channels": sample.channels,
-                "bit_depth": sample.bit_depth,
-            }
-            for sample in profile.samples
-        ]
+        # Convert AudioSample objects to dictionaries, summing durations in
+        # the same pass rather than walking the samples again via
+        # profile.total_duration
+        samples: list[dict[str, Any]] = []
+        append = samples.append
+        total_duration = 0.0
+        for sample in profile.samples:
+            duration = sample.duration
+            total_duration += duration
+            append(
+                {
+                    "path": str(sample.path),
+                    "duration": duration,
+                    "sample_rate": sample.sample_rate,
+                    "channels": sample.channels,
+                    "bit_depth": sample.bit_depth,
+                }
+            )
 
         return cls(
             id=profile.id,
             name=profile.name,
             samples=samples,
             created_at=profile.created_at.isoformat(),
-            total_duration=profile.total_duration,
+            total_duration=total_duration,
             language=profile.language,
             reference_text=profile.reference_text,
         )
@@ -105,8 +113,6 @@ class VoiceProfileDTO:
             This requires reconstructing AudioSample objects from the sample data.
             The samples should be validated before creating the entity.
         """
-        from domain.models.audio_sample import AudioSample
-
         # Reconstruct AudioSample objects
         audio_samples = [
             AudioSample(
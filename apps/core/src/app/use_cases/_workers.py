@@ -0,0 +1,23 @@
+"""Worker pool sizing shared by the use cases."""
+
+import os
+
+
+def default_max_workers(upper: int = 8) -> int:
+    """Get the default number of threads for per-sample work.
+
+    Counts the CPUs this process may run on rather than the CPUs in the
+    machine, so containers started with a CPU limit are not oversubscribed.
+
+    Args:
+        upper: Maximum number of workers to return (default: 8)
+
+    Returns:
+        Number of workers, between 1 and upper
+    """
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is not available on macOS or Windows
+        available = os.cpu_count() or 1
+    return max(1, min(upper, available))
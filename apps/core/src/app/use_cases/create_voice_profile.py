@@ -6,6 +6,7 @@ Use case for creating a new voice profile from audio samples.
 from pathlib import Path
 
 from app.dto.voice_profile_dto import VoiceProfileDTO
+from app.use_cases._workers import default_max_workers
 from domain.ports.audio_processor import AudioProcessor
 from domain.ports.profile_repository import ProfileRepository
 from domain.services.voice_cloning import VoiceCloningService
@@ -22,14 +23,21 @@ class CreateVoiceProfileUseCase:
         self,
         audio_processor: AudioProcessor,
         profile_repository: ProfileRepository,
+        max_workers: int | None = None,
     ):
         """Initialize the use case.
 
         Args:
             audio_processor: Audio processor port implementation
             profile_repository: Profile repository port implementation
+            max_workers: Maximum number of samples loaded concurrently
+                (default: the CPUs available to this process, at most 8)
         """
-        self._voice_cloning = VoiceCloningService(audio_processor)
+        if max_workers is None:
+            max_workers = default_max_workers()
+        self._voice_cloning = VoiceCloningService(
+            audio_processor, max_workers=max_workers
+        )
         self._repository = profile_repository
 
     def execute(
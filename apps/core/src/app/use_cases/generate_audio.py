@@ -4,10 +4,12 @@ Use case for generating audio from text using a voice profile.
 """
 
 import time
+import uuid
 from pathlib import Path
 
 from app.dto.generation_dto import GenerationRequestDTO, GenerationResultDTO
 from domain.exceptions import GenerationException, InvalidProfileException
+from domain.models.voice_profile import VoiceProfile
 from domain.ports.profile_repository import ProfileRepository
 from domain.ports.tts_engine import TTSEngine
 
@@ -33,11 +35,18 @@ class GenerateAudioUseCase:
         self._engine = tts_engine
         self._repository = profile_repository
 
-    def execute(self, request: GenerationRequestDTO) -> GenerationResultDTO:
+    def execute(
+        self,
+        request: GenerationRequestDTO,
+        profile: VoiceProfile | None = None,
+    ) -> GenerationResultDTO:
         """Execute the use case to generate audio.
 
         Args:
             request: Generation request with all parameters
+            profile: Voice profile already loaded and validated by the
+                caller. When omitted, the profile is looked up in the
+                repository and validated with the engine.
 
         Returns:
             GenerationResultDTO with generation results
@@ -45,25 +54,30 @@ class GenerateAudioUseCase:
         start_time = time.time()
 
         try:
-            # Load the voice profile
-            profile = self._repository.find_by_id(request.profile_id)
             if profile is None:
-                return GenerationResultDTO.error_result(
-                    error=f"Profile not found: {request.profile_id}",
-                    profile_id=request.profile_id,
-                )
-
-            # Validate profile with engine
-            if not self._engine.validate_profile(profile):
-                return GenerationResultDTO.error_result(
-                    error=f"Profile validation failed: {request.profile_id}",
-                    profile_id=request.profile_id,
-                )
+                # Load the voice profile
+                profile = self._repository.find_by_id(request.profile_id)
+                if profile is None:
+                    return GenerationResultDTO.error_result(
+                        error=f"Profile not found: {request.profile_id}",
+                        profile_id=request.profile_id,
+                    )
+
+                # Validate profile with engine
+                if not self._engine.validate_profile(profile):
+                    return GenerationResultDTO.error_result(
+                        error=f"Profile validation failed: {request.profile_id}",
+                        profile_id=request.profile_id,
+                    )
 
             # Generate output path if not provided
             output_path = request.output_path
             if output_path is None:
-                output_path = Path(f"output_{profile.id}_{int(time.time())}.wav")
+                # The random suffix keeps names unique within the same second
+                suffix = uuid.uuid4().hex[:8]
+                output_path = Path(
+                    f"output_{profile.id}_{int(start_time)}_{suffix}.wav"
+                )
 
             # Generate audio
             result_path = self._engine.generate_audio(
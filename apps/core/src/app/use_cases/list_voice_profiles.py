@@ -3,6 +3,8 @@
 Use case for listing all available voice profiles.
 """
 
+from collections.abc import Iterator
+
 from app.dto.voice_profile_dto import VoiceProfileDTO
 from domain.ports.profile_repository import ProfileRepository
 
@@ -28,8 +30,16 @@ class ListVoiceProfilesUseCase:
         Returns:
             List of VoiceProfileDTO objects
         """
-        # Get all profiles from repository
-        profiles = self._repository.list_all()
+        return list(self.iter())
+
+    def iter(self) -> Iterator[VoiceProfileDTO]:
+        """Yield profiles as DTOs one at a time.
 
-        # Convert to DTOs
-        return [VoiceProfileDTO.from_entity(profile) for profile in profiles]
+        Lets callers that immediately serialize the DTOs avoid holding an
+        intermediate list of them.
+
+        Yields:
+            VoiceProfileDTO for each profile in the repository
+        """
+        for profile in self._repository.list_all():
+            yield VoiceProfileDTO.from_entity(profile)
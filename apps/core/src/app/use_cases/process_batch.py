@@ -3,13 +3,22 @@
 Use case for processing multiple text segments in batch.
 """
 
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
 from app.dto.batch_dto import BatchRequestDTO, BatchResultDTO
-from app.dto.generation_dto import GenerationResultDTO
+from app.dto.generation_dto import GenerationRequestDTO, GenerationResultDTO
+from domain.exceptions import DomainException
+from domain.models.voice_profile import VoiceProfile
 from domain.ports.profile_repository import ProfileRepository
 from domain.ports.tts_engine import TTSEngine
 
 from .generate_audio import GenerateAudioUseCase
 
+logger = logging.getLogger(__name__)
+
 
 class ProcessBatchUseCase:
     """Use case for batch processing multiple text segments.
@@ -22,13 +31,21 @@ class ProcessBatchUseCase:
         self,
         tts_engine: TTSEngine,
         profile_repository: ProfileRepository,
+        max_workers: int = 1,
     ):
         """Initialize the use case.
 
         Args:
             tts_engine: TTS engine port implementation
             profile_repository: Profile repository port implementation
+            max_workers: Maximum number of segments generated concurrently
+                (default: 1). Only raise this for engines that are safe to
+                call from several threads at once. Unused when the engine
+                supports batching and the whole batch is generated at once.
         """
+        self._engine = tts_engine
+        self._repository = profile_repository
+        self._max_workers = max_workers
         self._generate_audio = GenerateAudioUseCase(tts_engine, profile_repository)
 
     def execute(self, request: BatchRequestDTO) -> BatchResultDTO:
@@ -46,11 +63,115 @@ class ProcessBatchUseCase:
         # Convert batch request to individual generation requests
         generation_requests = request.to_generation_requests()
 
-        # Process each segment
-        results: list[GenerationResultDTO] = []
-        for gen_request in generation_requests:
-            result = self._generate_audio.execute(gen_request)
-            results.append(result)
+        # Every segment uses the same profile, so load and validate it once
+        profile = self._load_profile(request.profile_id)
+
+        # Engines that decode several texts at once get the whole batch
+        if (
+            profile is not None
+            and generation_requests
+            and self._engine.get_capabilities().supports_batching
+        ):
+            batched = self._generate_batched(request, generation_requests, profile)
+            if batched is not None:
+                return BatchResultDTO.from_results(batched)
+
+        # Process each segment, preserving segment order
+        workers = min(self._max_workers, len(generation_requests))
+        results: list[GenerationResultDTO]
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(
+                        self._generate_audio.execute,
+                        generation_requests,
+                        repeat(profile),
+                    )
+                )
+        else:
+            results = [
+                self._generate_audio.execute(gen_request, profile)
+                for gen_request in generation_requests
+            ]
 
         # Create batch result from individual results
         return BatchResultDTO.from_results(results)
+
+    def _generate_batched(
+        self,
+        request: BatchRequestDTO,
+        generation_requests: list[GenerationRequestDTO],
+        profile: VoiceProfile,
+    ) -> list[GenerationResultDTO] | None:
+        """Generate every segment with a single engine call.
+
+        Args:
+            request: Batch request with the shared generation parameters
+            generation_requests: Per-segment requests, in segment order
+            profile: Profile already loaded and validated for the batch
+
+        Returns:
+            One result per segment, or None if the batch call failed. In that
+            case the segments are generated one by one, so each segment
+            reports its own error.
+        """
+        start_time = time.time()
+        try:
+            output_paths = self._engine.generate_batch(
+                texts=[gen_request.text for gen_request in generation_requests],
+                profile=profile,
+                # to_generation_requests sets an output path for every segment
+                output_paths=[
+                    gen_request.output_path
+                    for gen_request in generation_requests
+                    if gen_request.output_path is not None
+                ],
+                temperature=request.temperature,
+                speed=request.speed,
+                language=request.language,
+                mode=request.mode,
+            )
+        except Exception:
+            logger.warning(
+                "Batched generation failed for profile %s, "
+                "generating segments one by one",
+                profile.id,
+                exc_info=True,
+            )
+            return None
+
+        # Segments are decoded together, so each gets an equal share of time
+        generation_time = (time.time() - start_time) / len(generation_requests)
+        return [
+            GenerationResultDTO.success_result(
+                output_path=output_path,
+                duration=0.0,
+                profile_id=profile.id,
+                text_length=len(gen_request.text),
+                generation_time=generation_time,
+            )
+            for gen_request, output_path in zip(
+                generation_requests, output_paths, strict=True
+            )
+        ]
+
+    def _load_profile(self, profile_id: str) -> VoiceProfile | None:
+        """Load and validate the batch profile.
+
+        Args:
+            profile_id: ID of the profile shared by all segments
+
+        Returns:
+            The validated profile, or None if it is missing, invalid or
+            could not be loaded. In that case each segment looks the profile
+            up again and reports the error in its own result.
+        """
+        try:
+            profile = self._repository.find_by_id(profile_id)
+            if profile is not None and self._engine.validate_profile(profile):
+                return profile
+        except (DomainException, OSError, ValueError) as e:
+            logger.debug("Could not preload profile %s: %s", profile_id, e)
+        except Exception:
+            logger.exception("Unexpected error preloading profile %s", profile_id)
+        return None
@@ -3,14 +3,17 @@
 Use case for validating audio samples before creating a profile.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
+from app.use_cases._workers import default_max_workers
 from domain.exceptions import InvalidSampleException
 from domain.ports.audio_processor import AudioProcessor
 
 
-@dataclass
+@dataclass(slots=True)
 class SampleValidationResult:
     """Result of validating a single audio sample."""
 
@@ -22,8 +25,24 @@ class SampleValidationResult:
     channels: int | None = None
     bit_depth: int | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to a JSON-serializable dictionary.
 
-@dataclass
+        Returns:
+            Dictionary representation of the result
+        """
+        return {
+            "path": str(self.path),
+            "valid": self.valid,
+            "error": self.error,
+            "duration": self.duration,
+            "sample_rate": self.sample_rate,
+            "channels": self.channels,
+            "bit_depth": self.bit_depth,
+        }
+
+
+@dataclass(slots=True)
 class ValidationSummary:
     """Summary of validation results for multiple samples."""
 
@@ -46,13 +65,18 @@ class ValidateAudioSamplesUseCase:
     before creating a voice profile.
     """
 
-    def __init__(self, audio_processor: AudioProcessor):
+    def __init__(self, audio_processor: AudioProcessor, max_workers: int | None = None):
         """Initialize the use case.
 
         Args:
             audio_processor: Audio processor port implementation
+            max_workers: Maximum number of samples validated concurrently
+                (default: the CPUs available to this process, at most 8)
         """
         self._processor = audio_processor
+        if max_workers is None:
+            max_workers = default_max_workers()
+        self._max_workers = max_workers
 
     def execute(self, sample_paths: list[Path]) -> ValidationSummary:
         """Execute the use case to validate audio samples.
@@ -61,64 +85,73 @@ class ValidateAudioSamplesUseCase:
             sample_paths: List of paths to audio sample files
 
         Returns:
-            ValidationSummary with validation results for all samples
+            ValidationSummary with validation results for all samples,
+            in the same order as sample_paths
         """
-        results: list[SampleValidationResult] = []
+        workers = min(self._max_workers, len(sample_paths))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._validate_one, sample_paths))
+        else:
+            results = [self._validate_one(path) for path in sample_paths]
+
+        # Create summary, counting valid samples and their duration in one pass
+        valid_count = 0
         total_duration = 0.0
-
-        for path in sample_paths:
-            try:
-                # Validate the sample
-                is_valid = self._processor.validate_sample(path)
-
-                # If valid, process to get metadata
-                if is_valid:
-                    sample = self._processor.process_sample(path)
-                    results.append(
-                        SampleValidationResult(
-                            path=path,
-                            valid=True,
-                            duration=sample.duration,
-                            sample_rate=sample.sample_rate,
-                            channels=sample.channels,
-                            bit_depth=sample.bit_depth,
-                        )
-                    )
-                    total_duration += sample.duration
-                else:
-                    results.append(
-                        SampleValidationResult(
-                            path=path,
-                            valid=False,
-                            error="Validation failed",
-                        )
-                    )
-
-            except InvalidSampleException as e:
-                results.append(
-                    SampleValidationResult(
-                        path=path,
-                        valid=False,
-                        error=str(e),
-                    )
-                )
-            except Exception as e:
-                results.append(
-                    SampleValidationResult(
-                        path=path,
-                        valid=False,
-                        error=f"Unexpected error: {e}",
-                    )
-                )
-
-        # Create summary
-        valid_count = sum(1 for r in results if r.valid)
-        invalid_count = len(results) - valid_count
+        for r in results:
+            if r.valid:
+                valid_count += 1
+                if r.duration:
+                    total_duration += r.duration
 
         return ValidationSummary(
             total_samples=len(results),
             valid_samples=valid_count,
-            invalid_samples=invalid_count,
+            invalid_samples=len(results) - valid_count,
             results=results,
             total_duration=total_duration,
         )
+
+    def _validate_one(self, path: Path) -> SampleValidationResult:
+        """Validate a single audio sample.
+
+        Args:
+            path: Path to the audio sample file
+
+        Returns:
+            SampleValidationResult for the sample (never raises)
+        """
+        try:
+            # Validate the sample
+            is_valid = self._processor.validate_sample(path)
+
+            # If valid, process to get metadata
+            if is_valid:
+                sample = self._processor.process_sample(path)
+                return SampleValidationResult(
+                    path=path,
+                    valid=True,
+                    duration=sample.duration,
+                    sample_rate=sample.sample_rate,
+                    channels=sample.channels,
+                    bit_depth=sample.bit_depth,
+                )
+
+            return SampleValidationResult(
+                path=path,
+                valid=False,
+                error="Validation failed",
+            )
+
+        except InvalidSampleException as e:
+            return SampleValidationResult(
+                path=path,
+                valid=False,
+                error=str(e),
+            )
+        except Exception as e:
+            return SampleValidationResult(
+                path=path,
+                valid=False,
+                error=f"Unexpected error: {e}",
+            )
@@ -6,8 +6,13 @@ Immutable value object representing an audio sample for voice cloning.
 from dataclasses import dataclass
 from pathlib import Path
 
+# Qwen3-TTS sample requirements
+_MIN_DURATION = 3.0  # seconds
+_MAX_DURATION = 30.0  # seconds
+_SAMPLE_RATE = 12000  # Hz
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AudioSample:
     """Immutable audio sample value object.
 
@@ -23,17 +28,19 @@ class AudioSample:
     emotion: str | None = None
 
     def __post_init__(self) -> None:
-        """Validate audio sample after initialization."""
         """Validate audio sample on creation."""
-        if not self.is_valid_duration():
+        # Checks are inlined rather than calling is_valid_* since this runs
+        # for every sample on each profile load
+        if not _MIN_DURATION <= self.duration <= _MAX_DURATION:
             raise ValueError(
-                f"Invalid duration: {self.duration}s. Must be between 3 and 30 seconds."
+                f"Invalid duration: {self.duration}s. Must be between "
+                f"{_MIN_DURATION:g} and {_MAX_DURATION:g} seconds."
             )
 
-        if not self.is_valid_sample_rate():
+        if self.sample_rate != _SAMPLE_RATE:
             raise ValueError(
                 f"Invalid sample rate: {self.sample_rate} Hz. "
-                f"Must be 12000 Hz (Qwen3-TTS native)."
+                f"Must be {_SAMPLE_RATE} Hz (Qwen3-TTS native)."
             )
 
         if self.channels != 1:
@@ -48,17 +55,17 @@ class AudioSample:
         """Check if duration is within acceptable range.
 
         Returns:
-            True if duration is between 3 and 30 seconds
+            True if duration is between _MIN_DURATION and _MAX_DURATION
         """
-        return 3.0 <= self.duration <= 30.0
+        return _MIN_DURATION <= self.duration <= _MAX_DURATION
 
     def is_valid_sample_rate(self) -> bool:
         """Check if sample rate matches Qwen3-TTS native format.
 
         Returns:
-            True if sample rate is 12000 Hz
+            True if sample rate is _SAMPLE_RATE (Qwen3-TTS native)
         """
-        return self.sample_rate == 12000
+        return self.sample_rate == _SAMPLE_RATE
 
     def __str__(self) -> str:
         """String representation of audio sample."""
@@ -3,6 +3,7 @@
 Entity representing a voice profile with identity and behavior.
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -10,8 +11,22 @@ from uuid import uuid4
 
 from .audio_sample import AudioSample
 
+# Business rules for a profile's sample set
+_MAX_SAMPLES = 10
+_MIN_DURATION = 10.0
+_MAX_DURATION = 300.0
 
-@dataclass
+# Error templates built once from the limits above
+_MAX_SAMPLES_MSG = f"Profile has {{}} samples. Maximum is {_MAX_SAMPLES} samples."
+_MIN_DURATION_MSG = (
+    f"Total duration is {{:.1f}}s. Minimum is {_MIN_DURATION:.0f} seconds."
+)
+_MAX_DURATION_MSG = (
+    f"Total duration is {{:.1f}}s. Maximum is {_MAX_DURATION:.0f} seconds."
+)
+
+
+@dataclass(slots=True)
 class VoiceProfile:
     """Voice profile entity with identity.
 
@@ -57,8 +72,9 @@ class VoiceProfile:
             reference_text=reference_text,
         )
 
-        if not profile.is_valid():
-            raise ValueError(f"Invalid voice profile: {profile.validation_errors()}")
+        errors = profile.validation_errors()
+        if errors:
+            raise ValueError(f"Invalid voice profile: {errors}")
 
         return profile
 
@@ -72,18 +88,19 @@ class VoiceProfile:
             ValueError: If adding sample would make profile invalid
         """
         # Check if adding this sample would exceed limits
-        if len(self.samples) >= 10:
-            raise ValueError("Cannot add more samples. Maximum 10 samples per profile.")
+        if len(self.samples) >= _MAX_SAMPLES:
+            raise ValueError(
+                f"Cannot add more samples. Maximum {_MAX_SAMPLES} samples per profile."
+            )
 
         self.samples.append(sample)
 
         # Validate after adding
-        if not self.is_valid():
-            # Rollback
-            self.samples.remove(sample)
-            raise ValueError(
-                f"Adding sample would make profile invalid: {self.validation_errors()}"
-            )
+        errors = self.validation_errors()
+        if errors:
+            # Rollback the append (the new sample is last)
+            self.samples.pop()
+            raise ValueError(f"Adding sample would make profile invalid: {errors}")
 
     def remove_sample(self, sample_path: Path) -> bool:
         """Remove a sample from the profile.
@@ -97,14 +114,13 @@ class VoiceProfile:
         Raises:
             ValueError: If removing sample would make profile invalid
         """
-        # Find sample
-        sample_to_remove = None
-        for sample in self.samples:
-            if sample.path == sample_path:
-                sample_to_remove = sample
-                break
-
-        if sample_to_remove is None:
+        # Find sample index; deleting by index avoids a second scan with
+        # list.remove, which compares every field of each sample
+        index = next(
+            (i for i, sample in enumerate(self.samples) if sample.path == sample_path),
+            None,
+        )
+        if index is None:
             return False
 
         # Check if removing would make profile invalid
@@ -113,7 +129,7 @@ class VoiceProfile:
                 "Cannot remove sample. Profile must have at least 1 sample."
             )
 
-        self.samples.remove(sample_to_remove)
+        del self.samples[index]
         return True
 
     @property
@@ -128,10 +144,12 @@ class VoiceProfile:
     def is_valid(self) -> bool:
         """Check if profile meets all business rules.
 
+        Stops at the first failing rule.
+
         Returns:
             True if profile is valid
         """
-        return len(self.validation_errors()) == 0
+        return next(self._iter_errors(), None) is None
 
     def validation_errors(self) -> list[str]:
         """Get list of validation errors.
@@ -139,43 +157,42 @@ class VoiceProfile:
         Returns:
             List of error messages (empty if valid)
         """
-        errors = []
+        return list(self._iter_errors())
+
+    def _iter_errors(self) -> Iterator[str]:
+        """Yield validation error messages in rule order.
+
+        Yields:
+            Error message for each broken business rule
+        """
+        sample_count = len(self.samples)
 
         # Must have at least 1 sample
-        if len(self.samples) == 0:
-            errors.append("Profile must have at least 1 audio sample")
+        if sample_count == 0:
+            yield "Profile must have at least 1 audio sample"
 
         # Must have at most 10 samples
-        if len(self.samples) > 10:
-            errors.append(
-                f"Profile has {len(self.samples)} samples. Maximum is 10 samples."
-            )
+        if sample_count > _MAX_SAMPLES:
+            yield _MAX_SAMPLES_MSG.format(sample_count)
 
         # Total duration must be between 10 and 300 seconds
         total_dur = self.total_duration
-        if total_dur < 10.0:
-            errors.append(f"Total duration is {total_dur:.1f}s. Minimum is 10 seconds.")
-        if total_dur > 300.0:
-            errors.append(
-                f"Total duration is {total_dur:.1f}s. Maximum is 300 seconds."
+        if not _MIN_DURATION <= total_dur <= _MAX_DURATION:
+            template = (
+                _MIN_DURATION_MSG if total_dur < _MIN_DURATION else _MAX_DURATION_MSG
             )
+            yield template.format(total_dur)
 
         # Name must not be empty
-        if not self.name or not self.name.strip():
-            errors.append("Profile name cannot be empty")
+        if not self.name or self.name.isspace():
+            yield "Profile name cannot be empty"
 
         # All samples must be valid
         for i, sample in enumerate(self.samples):
             if not sample.is_valid_duration():
-                errors.append(
-                    f"Sample {i + 1} ({sample.path.name}) has invalid duration"
-                )
+                yield f"Sample {i + 1} ({sample.path.name}) has invalid duration"
             if not sample.is_valid_sample_rate():
-                errors.append(
-                    f"Sample {i + 1} ({sample.path.name}) has invalid sample rate"
-                )
-
-        return errors
+                yield f"Sample {i + 1} ({sample.path.name}) has invalid sample rate"
 
     def __str__(self) -> str:
         """String representation of voice profile."""
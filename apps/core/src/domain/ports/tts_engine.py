@@ -12,16 +12,18 @@ from typing import Any
 from ..models.voice_profile import VoiceProfile
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EngineCapabilities:
     """Capabilities and limitations of a TTS engine.
 
-    Used by the UI to enforce appropriate limits.
+    Used by the UI to enforce appropriate limits. Immutable, so adapters
+    and services can share a single instance.
     """
 
     max_text_length: int  # Maximum characters per generation
     recommended_text_length: int  # Recommended for best quality
     supports_streaming: bool = False  # Future: streaming generation
+    supports_batching: bool = False  # Several texts per generate_batch call
     min_sample_duration: float = 3.0  # Minimum seconds per sample
     max_sample_duration: float = 30.0  # Maximum seconds per sample
 
@@ -77,6 +79,38 @@ class TTSEngine(ABC):
         """
         ...
 
+    def generate_batch(
+        self,
+        texts: list[str],
+        profile: VoiceProfile,
+        output_paths: list[Path],
+        mode: str = "clone",
+        **kwargs: Any,
+    ) -> list[Path]:
+        """Generate audio for several texts using one voice profile.
+
+        Engines that decode several texts in one call override this and set
+        EngineCapabilities.supports_batching. The default generates the
+        texts one at a time.
+
+        Args:
+            texts: Texts to convert to speech
+            profile: Voice profile to use for generation
+            output_paths: Where to save each generated audio, in text order
+            mode: Generation mode (e.g., "clone", "custom", "design")
+            **kwargs: Additional engine-specific parameters
+
+        Returns:
+            Paths to the generated audio files, in the order of texts
+
+        Raises:
+            GenerationException: If generation fails
+        """
+        return [
+            self.generate_audio(text, profile, output_path, mode=mode, **kwargs)
+            for text, output_path in zip(texts, output_paths, strict=True)
+        ]
+
     @abstractmethod
     def validate_profile(self, profile: VoiceProfile) -> bool:
         """Validate that a profile is compatible with this engine.
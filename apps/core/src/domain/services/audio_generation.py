@@ -6,7 +6,7 @@ Contains business logic for audio generation orchestration.
 from pathlib import Path
 
 from ..models.voice_profile import VoiceProfile
-from ..ports.tts_engine import TTSEngine
+from ..ports.tts_engine import EngineCapabilities, TTSEngine
 
 
 class AudioGenerationService:
@@ -29,6 +29,35 @@ class AudioGenerationService:
             tts_engine: TTS engine port for audio generation
         """
         self._tts_engine = tts_engine
+        # Engine capabilities and modes are queried on first use and kept
+        # until refresh_engine_info() is called
+        self._capabilities: EngineCapabilities | None = None
+        self._supported_modes: frozenset[str] | None = None
+        self._supported_modes_order: tuple[str, ...] = ()
+
+    def refresh_engine_info(self) -> None:
+        """Drop cached engine capabilities and supported modes.
+
+        Call this after the engine is reloaded or reconfigured, so the next
+        generation queries the engine again.
+        """
+        self._capabilities = None
+        self._supported_modes = None
+        self._supported_modes_order = ()
+
+    def _get_capabilities(self) -> EngineCapabilities:
+        """Get the engine capabilities, querying the engine when not cached."""
+        if self._capabilities is None:
+            self._capabilities = self._tts_engine.get_capabilities()
+        return self._capabilities
+
+    def _get_supported_modes(self) -> frozenset[str]:
+        """Get the engine's supported modes, querying it when not cached."""
+        if self._supported_modes is None:
+            modes = tuple(self._tts_engine.get_supported_modes())
+            self._supported_modes_order = modes
+            self._supported_modes = frozenset(modes)
+        return self._supported_modes
 
     def generate_with_profile(
         self,
@@ -61,11 +90,11 @@ class AudioGenerationService:
             GenerationException: If generation fails
         """
         # Validate inputs
-        if not text or not text.strip():
+        if not text or text.isspace():
             raise ValueError("Text cannot be empty")
 
         # Validate text length against engine capabilities
-        capabilities = self._tts_engine.get_capabilities()
+        capabilities = self._get_capabilities()
         text_length = len(text)
 
         if text_length > capabilities.max_text_length:
@@ -86,15 +115,15 @@ class AudioGenerationService:
                 f"Quality may be degraded. Consider using shorter text for best results."
             )
 
-        if not profile.is_valid():
-            raise ValueError(f"Invalid profile: {profile.validation_errors()}")
+        profile_errors = profile.validation_errors()
+        if profile_errors:
+            raise ValueError(f"Invalid profile: {profile_errors}")
 
         # Validate mode is supported
-        supported_modes = self._tts_engine.get_supported_modes()
-        if mode not in supported_modes:
+        if mode not in self._get_supported_modes():
             raise ValueError(
                 f"Unsupported mode '{mode}'. "
-                f"Supported modes: {', '.join(supported_modes)}"
+                f"Supported modes: {', '.join(self._supported_modes_order)}"
             )
 
         # Validate profile is compatible with engine
@@ -3,11 +3,16 @@
 Contains business logic for creating voice profiles from audio samples.
 """
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TypeVar
 
 from ..models.voice_profile import VoiceProfile
 from ..ports.audio_processor import AudioProcessor
 
+T = TypeVar("T")
+
 
 class VoiceCloningService:
     """Domain service for voice cloning operations.
@@ -16,13 +21,32 @@ class VoiceCloningService:
     applying business rules and validation logic.
     """
 
-    def __init__(self, audio_processor: AudioProcessor):
+    def __init__(self, audio_processor: AudioProcessor, max_workers: int = 1):
         """Initialize the voice cloning service.
 
         Args:
             audio_processor: Audio processor port for sample validation/processing
+            max_workers: Maximum number of samples validated or processed
+                concurrently (default: 1, sequential)
         """
         self._audio_processor = audio_processor
+        self._max_workers = max_workers
+
+    def _map(self, fn: Callable[[Path], T], sample_paths: list[Path]) -> list[T]:
+        """Apply fn to every sample path, preserving order.
+
+        Args:
+            fn: Per-sample audio processor call
+            sample_paths: List of paths to audio samples
+
+        Returns:
+            Results in the same order as sample_paths
+        """
+        workers = min(self._max_workers, len(sample_paths))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(fn, sample_paths))
+        return [fn(path) for path in sample_paths]
 
     def create_profile_from_samples(
         self,
@@ -52,15 +76,19 @@ class VoiceCloningService:
             ValueError: If profile cannot be created
         """
         # Validate all samples first
-        for sample_path in sample_paths:
-            if not self._audio_processor.validate_sample(sample_path):
-                raise ValueError(f"Invalid sample: {sample_path}")
+        if self._max_workers > 1:
+            results = self._map(self._audio_processor.validate_sample, sample_paths)
+            for sample_path, is_valid in zip(sample_paths, results, strict=True):
+                if not is_valid:
+                    raise ValueError(f"Invalid sample: {sample_path}")
+        else:
+            # Sequentially, stop at the first invalid sample
+            for sample_path in sample_paths:
+                if not self._audio_processor.validate_sample(sample_path):
+                    raise ValueError(f"Invalid sample: {sample_path}")
 
         # Process samples to create AudioSample value objects
-        samples = []
-        for sample_path in sample_paths:
-            audio_sample = self._audio_processor.process_sample(sample_path)
-            samples.append(audio_sample)
+        samples = self._map(self._audio_processor.process_sample, sample_paths)
 
         # Create voice profile using factory method
         # This will validate business rules (1-10 samples, 10-300s duration, etc.)
@@ -82,11 +110,8 @@ class VoiceCloningService:
         Returns:
             True if profile is valid for cloning
         """
-        # Check basic validity
-        if not profile.is_valid():
-            return False
-
-        # Additional business rules for cloning
+        # Additional business rules for cloning, checked first since the
+        # sample count is O(1) and basic validity sums durations anyway
         # At least 2 samples recommended for better quality
         if len(profile.samples) < 2:
             return False
@@ -95,4 +120,5 @@ class VoiceCloningService:
         if profile.total_duration < 20.0:
             return False
 
-        return True
+        # Check basic validity
+        return profile.is_valid()
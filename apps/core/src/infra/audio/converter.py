@@ -3,9 +3,51 @@
 Provides utilities for converting audio between different formats using ffmpeg.
 """
 
+import logging
 import subprocess
 from pathlib import Path
 
+import soundfile as sf
+
+# ffmpeg invocation that only writes errors to stderr (no banner, stream
+# info or progress), so the captured pipe stays small
+FFMPEG_CMD = ("ffmpeg", "-hide_banner", "-nostats", "-loglevel", "error")
+
+logger = logging.getLogger(__name__)
+
+
+def _probe_duration(path: Path) -> float:
+    """Get an audio file's duration without decoding it.
+
+    Reads the header with soundfile, falling back to ffprobe for formats
+    libsndfile cannot open (e.g. mp3/aac on older builds).
+
+    Args:
+        path: Audio file path
+
+    Returns:
+        Duration in seconds
+    """
+    try:
+        return float(sf.info(path).duration)
+    except RuntimeError:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                str(path),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return float(result.stdout.strip())
+
 
 class AudioConverter:
     """Handles audio format conversions using ffmpeg."""
@@ -43,6 +85,36 @@ class AudioConverter:
             input_path: Input audio file path
             output_path: Output audio file path
 
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.process_pipeline(input_path, output_path)
+
+    def process_pipeline(
+        self,
+        input_path: Path | str,
+        output_path: Path | str,
+        *,
+        remove_silence: bool = False,
+        normalize_lufs: float | None = None,
+        fade_in: float | None = None,
+        fade_out: float | None = None,
+    ) -> bool:
+        """Convert to target format and apply effects in a single ffmpeg run.
+
+        Equivalent to chaining AudioEffects.remove_silence,
+        AudioEffects.normalize_loudness, AudioEffects.apply_fade and
+        convert_to_target_format, but decodes and encodes the audio once
+        and writes no intermediate files.
+
+        Args:
+            input_path: Input audio file path
+            output_path: Output audio file path
+            remove_silence: Remove leading and trailing silence
+            normalize_lufs: Target loudness in LUFS (None to skip)
+            fade_in: Fade in duration in seconds (None to skip)
+            fade_out: Fade out duration in seconds (None to skip)
+
         Returns:
             True if successful, False otherwise
         """
@@ -50,14 +122,28 @@ class AudioConverter:
         output_path = Path(output_path)
 
         try:
-            # Ensure output directory exists
+            filters = []
+            if fade_out is not None:
+                # Timed against the input, so the fade-out streams instead of
+                # buffering the output to find its end; silence removal only
+                # trims what follows
+                start = max(0.0, _probe_duration(input_path) - fade_out)
+                filters.append(f"afade=t=out:st={start}:d={fade_out}")
+            if remove_silence:
+                filters.append(
+                    "silenceremove=start_periods=1:stop_periods=-1:detection=peak"
+                )
+            if normalize_lufs is not None:
+                filters.append(f"loudnorm=I={normalize_lufs}:TP=-1.5:LRA=11")
+            if fade_in is not None:
+                filters.append(f"afade=t=in:st=0:d={fade_in}")
+
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Build ffmpeg command
-            cmd = [
-                "ffmpeg",
-                "-i",
-                str(input_path),
+            cmd = [*FFMPEG_CMD, "-i", str(input_path)]
+            if filters:
+                cmd += ["-af", ",".join(filters)]
+            cmd += [
                 "-ar",
                 str(self.sample_rate),
                 "-ac",
@@ -68,22 +154,22 @@ class AudioConverter:
                 str(output_path),
             ]
 
-            # Run ffmpeg
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=False,
             )
 
             if result.returncode != 0:
-                print(f"FFmpeg error: {result.stderr}")
+                logger.error("FFmpeg error: %s", result.stderr)
                 return False
 
             return output_path.exists()
 
         except Exception as e:
-            print(f"Conversion failed: {str(e)}")
+            logger.error("Conversion failed: %s", e)
             return False
 
     def convert_sample_rate(
@@ -109,7 +195,7 @@ class AudioConverter:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             cmd = [
-                "ffmpeg",
+                *FFMPEG_CMD,
                 "-i",
                 str(input_path),
                 "-ar",
@@ -118,7 +204,9 @@ class AudioConverter:
                 str(output_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, check=False)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+            )
             return result.returncode == 0 and output_path.exists()
 
         except Exception:
@@ -150,7 +238,7 @@ class AudioConverter:
 
             if format_type == "mp3":
                 cmd = [
-                    "ffmpeg",
+                    *FFMPEG_CMD,
                     "-i",
                     str(input_path),
                     "-codec:a",
@@ -162,7 +250,7 @@ class AudioConverter:
                 ]
             elif format_type == "aac":
                 cmd = [
-                    "ffmpeg",
+                    *FFMPEG_CMD,
                     "-i",
                     str(input_path),
                     "-codec:a",
@@ -174,7 +262,7 @@ class AudioConverter:
                 ]
             elif format_type == "flac":
                 cmd = [
-                    "ffmpeg",
+                    *FFMPEG_CMD,
                     "-i",
                     str(input_path),
                     "-codec:a",
@@ -187,7 +275,9 @@ class AudioConverter:
             else:
                 return False
 
-            result = subprocess.run(cmd, capture_output=True, check=False)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+            )
             return result.returncode == 0 and output_path.exists()
 
         except Exception:
@@ -6,7 +6,7 @@ Provides utilities for applying effects like fade, silence removal, etc.
 import subprocess
 from pathlib import Path
 
-import librosa
+from .converter import FFMPEG_CMD, _probe_duration
 
 
 class AudioEffects:
@@ -35,14 +35,13 @@ class AudioEffects:
 
         try:
             # Get audio duration
-            audio, sr = librosa.load(input_path, sr=None)
-            duration = librosa.get_duration(y=audio, sr=sr)
+            duration = _probe_duration(input_path)
             fade_out_start = max(0, duration - fade_out_duration)
 
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             cmd = [
-                "ffmpeg",
+                *FFMPEG_CMD,
                 "-i",
                 str(input_path),
                 "-af",
@@ -51,7 +50,9 @@ class AudioEffects:
                 str(output_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, check=False)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+            )
             return result.returncode == 0 and output_path.exists()
 
         except Exception:
@@ -78,7 +79,7 @@ class AudioEffects:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             cmd = [
-                "ffmpeg",
+                *FFMPEG_CMD,
                 "-i",
                 str(input_path),
                 "-af",
@@ -87,7 +88,9 @@ class AudioEffects:
                 str(output_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, check=False)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+            )
             return result.returncode == 0 and output_path.exists()
 
         except Exception:
@@ -116,7 +119,7 @@ class AudioEffects:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             cmd = [
-                "ffmpeg",
+                *FFMPEG_CMD,
                 "-i",
                 str(input_path),
                 "-af",
@@ -125,7 +128,9 @@ class AudioEffects:
                 str(output_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, check=False)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+            )
             return result.returncode == 0 and output_path.exists()
 
         except Exception:
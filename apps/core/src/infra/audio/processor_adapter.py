@@ -3,17 +3,19 @@
 Implements the AudioProcessor port using librosa and ffmpeg.
 """
 
+import copy
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
-import librosa
 import soundfile as sf
 
 from domain.exceptions import InvalidSampleException
 from domain.models.audio_sample import AudioSample
 from domain.ports.audio_processor import AudioProcessor
 
-from .validator import AudioValidator
+from .converter import FFMPEG_CMD
+from .validator import _SUBTYPE_BITS, AudioValidator, ValidationResult
 
 
 class LibrosaAudioProcessor(AudioProcessor):
@@ -40,6 +42,43 @@ class LibrosaAudioProcessor(AudioProcessor):
         self.channels = channels
         self.bit_depth = bit_depth
         self.validator = AudioValidator(sample_rate, channels, bit_depth)
+        # Validation streams every frame to find the peak. Callers typically
+        # validate a sample and then process it, and process_sample
+        # validates again, so reuse results for files that have not changed.
+        self._validate_file = lru_cache(maxsize=32)(self._run_validator)
+
+    def _run_validator(
+        self, sample_path: Path, mtime_ns: int, size: int
+    ) -> ValidationResult:
+        """Run the validator on a file.
+
+        Args:
+            sample_path: Path to the audio file
+            mtime_ns: File modification time, part of the cache key only
+            size: File size in bytes, part of the cache key only
+
+        Returns:
+            ValidationResult for the file
+        """
+        return self.validator.validate(sample_path)
+
+    def _validate(self, sample_path: Path) -> ValidationResult:
+        """Validate a file, reusing the result if the file is unchanged.
+
+        Args:
+            sample_path: Path to the audio file
+
+        Returns:
+            ValidationResult for the file, owned by the caller
+        """
+        try:
+            stat = sample_path.stat()
+        except OSError:
+            # Let the validator report the missing/unreadable file
+            return self.validator.validate(sample_path)
+        # The cached result is shared, so hand out a copy callers may modify
+        cached = self._validate_file(sample_path, stat.st_mtime_ns, stat.st_size)
+        return copy.deepcopy(cached)
 
     def validate_sample(self, sample_path: Path) -> bool:
         """Validate an audio sample meets requirements.
@@ -53,7 +92,7 @@ class LibrosaAudioProcessor(AudioProcessor):
         Raises:
             InvalidSampleException: If sample is invalid
         """
-        result = self.validator.validate(sample_path)
+        result = self._validate(sample_path)
 
         if not result.is_valid():
             error_msg = "\n".join(result.errors)
@@ -66,7 +105,7 @@ class LibrosaAudioProcessor(AudioProcessor):
     def process_sample(self, sample_path: Path) -> AudioSample:
         """Process an audio file and create an AudioSample.
 
-        This method loads the audio file, extracts metadata,
+        This method validates the audio file, reads its metadata,
         and creates an AudioSample value object.
 
         Args:
@@ -82,28 +121,21 @@ class LibrosaAudioProcessor(AudioProcessor):
         self.validate_sample(sample_path)
 
         try:
-            # Load audio to get metadata
-            audio, sr = librosa.load(sample_path, sr=None, mono=False)
-            duration = librosa.get_duration(y=audio, sr=sr)
-
-            # Get file info
+            # Validation has already decoded the audio; the metadata needed
+            # here is all in the file header, so avoid a second decode
             info = sf.info(sample_path)
 
             # Extract bit depth from subtype (e.g., "PCM_16" -> 16)
             bit_depth = self.bit_depth  # Default
-            if hasattr(info, "subtype") and info.subtype:
-                # Try to extract bit depth from subtype string
-                import re
-
-                match = re.search(r"(\d+)", info.subtype)
-                if match:
-                    bit_depth = int(match.group(1))
+            subtype = getattr(info, "subtype", None)
+            if subtype:
+                bit_depth = _SUBTYPE_BITS.get(subtype, bit_depth)
 
             # Create AudioSample
             return AudioSample(
                 path=sample_path,
-                duration=duration,
-                sample_rate=int(sr),  # Convert to int for type safety
+                duration=info.duration,
+                sample_rate=int(info.samplerate),  # Convert to int for type safety
                 channels=info.channels,
                 bit_depth=bit_depth,
             )
@@ -133,7 +165,7 @@ class LibrosaAudioProcessor(AudioProcessor):
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             cmd = [
-                "ffmpeg",
+                *FFMPEG_CMD,
                 "-i",
                 str(input_path),
                 "-af",
@@ -142,7 +174,9 @@ class LibrosaAudioProcessor(AudioProcessor):
                 str(output_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, check=False)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+            )
 
             if result.returncode != 0 or not output_path.exists():
                 raise InvalidSampleException(
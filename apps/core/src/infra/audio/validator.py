@@ -3,14 +3,28 @@
 Validates audio files against Qwen3-TTS requirements.
 """
 
+import errno
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import librosa
-import numpy as np
 import soundfile as sf
 
+# Frames read per block when scanning for clipping
+_PEAK_BLOCK_FRAMES = 65536
+
+# Sample width of PCM/float soundfile subtypes; compressed formats have none
+_SUBTYPE_BITS = {
+    "PCM_S8": 8,
+    "PCM_U8": 8,
+    "PCM_16": 16,
+    "PCM_24": 24,
+    "PCM_32": 32,
+    "FLOAT": 32,
+    "DOUBLE": 64,
+}
+
 
 @dataclass
 class ValidationResult:
@@ -100,14 +114,23 @@ class AudioValidator:
         file_path = Path(file_path)
         errors = []
         warnings = []
-        metadata = {}
+        metadata: dict[str, Any] = {}
 
         try:
-            # Load audio file
-            audio, sr = librosa.load(file_path, sr=None, mono=False)
+            if not file_path.exists():
+                raise FileNotFoundError(
+                    errno.ENOENT, os.strerror(errno.ENOENT), str(file_path)
+                )
 
-            # Get audio info
-            info = sf.info(file_path)
+            try:
+                sr, num_channels, subtype, duration, max_amplitude = self._read_stats(
+                    file_path
+                )
+            except sf.LibsndfileError:
+                # Formats libsndfile can't open (e.g. m4a) go through librosa
+                sr, num_channels, subtype, duration, max_amplitude = (
+                    self._read_stats_librosa(file_path)
+                )
 
             # Check sample rate
             if sr != self.sample_rate:
@@ -117,11 +140,6 @@ class AudioValidator:
             metadata["sample_rate"] = sr
 
             # Check channels
-            if len(audio.shape) > 1:
-                num_channels = audio.shape[0]
-            else:
-                num_channels = 1
-
             if num_channels != self.channels:
                 errors.append(
                     f"Audio has {num_channels} channels (required: {self.channels} for mono)"
@@ -129,15 +147,15 @@ class AudioValidator:
             metadata["channels"] = num_channels
 
             # Check bit depth
-            if hasattr(info, "subtype"):
-                if "16" not in info.subtype and self.bit_depth == 16:
+            if subtype is not None:
+                if _SUBTYPE_BITS.get(subtype) != self.bit_depth:
                     warnings.append(
-                        f"Bit depth is {info.subtype} (recommended: 16-bit PCM)"
+                        f"Bit depth is {subtype} "
+                        f"(recommended: {self.bit_depth}-bit PCM)"
                     )
-                metadata["bit_depth"] = info.subtype
+                metadata["bit_depth"] = subtype
 
             # Check duration (Qwen3-TTS requires minimum 3 seconds)
-            duration = librosa.get_duration(y=audio, sr=sr)
             metadata["duration"] = duration
 
             if duration < 3.0:
@@ -150,13 +168,6 @@ class AudioValidator:
                 )
 
             # Check for clipping
-            if len(audio.shape) > 1:
-                # Stereo: check both channels
-                max_amplitude = np.max(np.abs(audio))
-            else:
-                # Mono
-                max_amplitude = np.max(np.abs(audio))
-
             if max_amplitude >= 0.99:  # Close to maximum
                 errors.append(
                     "Audio clipping detected (distortion). Re-record with lower volume."
@@ -180,3 +191,57 @@ class AudioValidator:
                 warnings=[],
                 metadata={},
             )
+
+    @staticmethod
+    def _read_stats(file_path: Path) -> tuple[int, int, str | None, float, float]:
+        """Read audio properties with soundfile, streaming the samples.
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            Tuple of (sample_rate, channels, subtype, duration, max_amplitude)
+
+        Raises:
+            soundfile.LibsndfileError: If libsndfile can't open the file
+        """
+        info = sf.info(file_path)
+
+        # Peak over all channels; max/-min avoids an abs() copy of every block
+        max_amplitude = 0.0
+        for block in sf.blocks(
+            file_path, blocksize=_PEAK_BLOCK_FRAMES, dtype="float32"
+        ):
+            max_amplitude = max(max_amplitude, float(block.max()), -float(block.min()))
+
+        return (
+            int(info.samplerate),
+            int(info.channels),
+            info.subtype,
+            float(info.duration),
+            max_amplitude,
+        )
+
+    @staticmethod
+    def _read_stats_librosa(
+        file_path: Path,
+    ) -> tuple[int, int, str | None, float, float]:
+        """Read audio properties by decoding the whole file with librosa.
+
+        Used for compressed formats libsndfile can't open; librosa decodes
+        them through audioread. These formats have no PCM subtype.
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            Tuple of (sample_rate, channels, None, duration, max_amplitude)
+        """
+        import librosa
+
+        audio, sr = librosa.load(file_path, sr=None, mono=False)
+        num_channels = audio.shape[0] if audio.ndim > 1 else 1
+        duration = librosa.get_duration(y=audio, sr=sr)
+        max_amplitude = max(float(audio.max()), -float(audio.min()))
+
+        return int(sr), num_channels, None, float(duration), max_amplitude
@@ -10,6 +10,9 @@ from domain.ports.config_provider import ConfigProvider
 
 logger = logging.getLogger(__name__)
 
+# Marker for dotted keys that do not resolve to a value
+_MISSING = object()
+
 
 class DictConfigProvider(ConfigProvider):
     """Dictionary-based configuration provider.
@@ -25,10 +28,16 @@ class DictConfigProvider(ConfigProvider):
             config: Configuration dictionary
         """
         self._config = config.copy()
+        # Resolved values keyed by dotted path, cleared whenever config changes
+        self._lookup_cache: dict[str, Any] = {}
 
     def reload(self) -> None:
-        """Reload configuration (no-op for dict provider)."""
-        pass
+        """Reload configuration.
+
+        There is nothing to re-read for a dict provider; this only drops
+        memoized lookups.
+        """
+        self._lookup_cache.clear()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value using dot notation.
@@ -40,16 +49,33 @@ class DictConfigProvider(ConfigProvider):
         Returns:
             Configuration value or default
         """
-        # Split key by dots for nested access
-        keys = key.split(".")
-        value = self._config
+        value = self._lookup(key)
+        return default if value is _MISSING else value
 
-        for k in keys:
+    def _lookup(self, key: str) -> Any:
+        """Resolve a dotted key, memoizing the result.
+
+        Args:
+            key: Configuration key (supports dot notation)
+
+        Returns:
+            Configuration value, or _MISSING if the key does not exist
+        """
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
+
+        # Split key by dots for nested access
+        value: Any = self._config
+        for k in key.split("."):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                value = _MISSING
+                break
 
+        self._lookup_cache[key] = value
         return value
 
     def get_all(self) -> dict[str, Any]:
@@ -78,6 +104,7 @@ class DictConfigProvider(ConfigProvider):
 
         # Set the value
         config[keys[-1]] = value
+        self._lookup_cache.clear()
 
     def has(self, key: str) -> bool:
         """Check if a configuration key exists.
@@ -88,13 +115,4 @@ class DictConfigProvider(ConfigProvider):
         Returns:
             True if key exists, False otherwise
         """
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return False
-
-        return True
+        return self._lookup(key) is not _MISSING
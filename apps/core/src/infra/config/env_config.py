@@ -12,6 +12,16 @@ from domain.ports.config_provider import ConfigProvider
 
 logger = logging.getLogger(__name__)
 
+# Marker for dotted keys that do not resolve to a value
+_MISSING = object()
+
+# Lowercased spellings of boolean values
+_TRUE_VALUES = frozenset({"true", "yes", "1", "on"})
+_FALSE_VALUES = frozenset({"false", "no", "0", "off"})
+
+# The only strings starting with a letter that float() accepts
+_FLOAT_WORDS = frozenset({"inf", "infinity", "nan"})
+
 
 class EnvConfigProvider(ConfigProvider):
     """Environment variable-based configuration provider.
@@ -37,18 +47,26 @@ class EnvConfigProvider(ConfigProvider):
         self.prefix = prefix
         self.separator = separator
         self._config: dict[str, Any] = {}
+        # Resolved values keyed by dotted path, cleared whenever config changes
+        self._lookup_cache: dict[str, Any] = {}
         self.reload()
 
     def reload(self) -> None:
         """Reload configuration from environment variables."""
+        self._lookup_cache.clear()
         self._config = {}
 
-        # Find all environment variables with our prefix
-        for key, value in os.environ.items():
-            if key.startswith(self.prefix):
+        # Find all environment variables with our prefix. Iterate names only:
+        # os.environ decodes each value on access, so values of unrelated
+        # variables are never decoded.
+        environ = os.environ
+        prefix = self.prefix
+        prefix_len = len(prefix)
+        for key in environ:
+            if key.startswith(prefix):
                 # Remove prefix and convert to nested dict
-                config_key = key[len(self.prefix) :].lower()
-                self._set_nested(config_key, self._convert_type(value))
+                config_key = key[prefix_len:].lower()
+                self._set_nested(config_key, self._convert_type(environ[key]))
 
         logger.debug(f"Loaded {len(self._config)} config values from environment")
 
@@ -81,11 +99,17 @@ class EnvConfigProvider(ConfigProvider):
             Converted value (int, float, bool, or str)
         """
         # Try boolean
-        if value.lower() in ("true", "yes", "1", "on"):
+        lowered = value.lower()
+        if lowered in _TRUE_VALUES:
             return True
-        if value.lower() in ("false", "no", "0", "off"):
+        if lowered in _FALSE_VALUES:
             return False
 
+        # Words (device names, model ids) can't be numbers; skip the
+        # int/float attempts and the exceptions they raise
+        if value[:1].isalpha() and lowered.strip() not in _FLOAT_WORDS:
+            return value
+
         # Try integer
         try:
             return int(value)
@@ -111,15 +135,32 @@ class EnvConfigProvider(ConfigProvider):
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self._config
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def _lookup(self, key: str) -> Any:
+        """Resolve a dotted key, memoizing the result.
+
+        Args:
+            key: Configuration key (supports dot notation)
+
+        Returns:
+            Configuration value, or _MISSING if the key does not exist
+        """
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
 
-        for k in keys:
+        value: Any = self._config
+        for k in key.split("."):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                value = _MISSING
+                break
 
+        self._lookup_cache[key] = value
         return value
 
     def get_all(self) -> dict[str, Any]:
@@ -4,16 +4,19 @@ Implementation of ConfigProvider port using YAML files.
 Supports default config + user overrides pattern.
 """
 
+import copy
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from domain.ports.config_provider import ConfigProvider
 
 logger = logging.getLogger(__name__)
 
+# Marker for dotted keys that do not resolve to a value
+_MISSING = object()
+
 
 class YAMLConfigProvider(ConfigProvider):
     """YAML-based configuration provider.
@@ -23,46 +26,147 @@ class YAMLConfigProvider(ConfigProvider):
     - User overrides (git-ignored)
     - Dot notation for nested keys (e.g., "model.device")
     - Configuration reloading without restart
+    - In-process parse cache shared by all providers (cheap reloads)
     """
 
-    def __init__(self, default_config_path: Path, user_config_path: Path | None = None):
+    def __init__(
+        self,
+        default_config_path: Path,
+        user_config_path: Path | None = None,
+        use_cache: bool = True,
+    ):
         """Initialize YAML config provider.
 
         Args:
             default_config_path: Path to default config file (required)
             user_config_path: Path to user config file (optional overrides)
+            use_cache: Reuse parse results within this process while the YAML
+                files are unchanged (default: True)
         """
         self.default_config_path = Path(default_config_path)
         self.user_config_path = Path(user_config_path) if user_config_path else None
+        self.use_cache = use_cache
         self._config: dict[str, Any] = {}
+        # Resolved values keyed by dotted path, cleared whenever config changes
+        self._lookup_cache: dict[str, Any] = {}
+        # File stamps the current config was loaded from; None forces a reload
+        self._stamps: tuple[Any, ...] | None = None
         self.reload()
 
     def reload(self) -> None:
         """Reload configuration from YAML files.
 
         Loads default config first, then merges user config if it exists.
+        When caching is enabled and neither file has changed since the last
+        reload (and nothing was set at runtime), the current config is kept.
         """
+        stamps = (
+            self._stamp(self.default_config_path),
+            self._stamp(self.user_config_path) if self.user_config_path else None,
+        )
+
         # Load default config
-        if not self.default_config_path.exists():
+        if stamps[0] is None:
             raise FileNotFoundError(
                 f"Default config not found: {self.default_config_path}"
             )
 
-        with open(self.default_config_path, encoding="utf-8") as f:
-            self._config = yaml.safe_load(f) or {}
+        if self.use_cache and stamps == self._stamps:
+            logger.debug("Config files unchanged, skipping reload")
+            return
+
+        self._lookup_cache.clear()
+        self._config = self._load_yaml(self.default_config_path)
 
         logger.debug(f"Loaded default config from {self.default_config_path}")
 
         # Merge user config if it exists
-        if self.user_config_path and self.user_config_path.exists():
-            with open(self.user_config_path, encoding="utf-8") as f:
-                user_config = yaml.safe_load(f) or {}
+        if self.user_config_path and stamps[1] is not None:
+            user_config = self._load_yaml(self.user_config_path)
 
             self._merge_config(self._config, user_config)
             logger.debug(f"Merged user config from {self.user_config_path}")
         else:
             logger.debug("No user config found, using defaults only")
 
+        self._stamps = stamps
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple[int, int] | None:
+        """Get a file's modification time and size.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            (st_mtime_ns, st_size), or None if the file does not exist
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _parse_yaml(path: Path) -> dict[str, Any]:
+        """Parse a YAML file with the fastest available safe loader.
+
+        Args:
+            path: Path to the YAML file
+
+        Returns:
+            Parsed configuration dictionary (empty if the file is empty)
+        """
+        # Imported on first parse so importing this module stays cheap
+        # (PyYAML takes ~30ms to import)
+        import yaml
+
+        try:
+            # libyaml-backed loader is several times faster than the pure-Python one
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader  # type: ignore[assignment]
+
+        with open(path, encoding="utf-8") as f:
+            return yaml.load(f, Loader=SafeLoader) or {}
+
+    def _load_yaml(self, path: Path) -> dict[str, Any]:
+        """Load a YAML file, reusing the parse result of an unchanged file.
+
+        Args:
+            path: Path to the YAML file
+
+        Returns:
+            Parsed configuration dictionary (a fresh copy the caller may mutate)
+        """
+        if not self.use_cache:
+            return self._parse_yaml(path)
+
+        stat = path.stat()
+        # Copied because reload() merges into the result and set() writes to it
+        return copy.deepcopy(
+            self._parse_yaml_cached(path, stat.st_mtime_ns, stat.st_size)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_yaml_cached(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+        """Parse a YAML file, memoized per process.
+
+        Keyed on the file's mtime and size, so any edit to the YAML file is
+        parsed again. Repeated reloads and providers sharing the same default
+        config skip the parse. The result is shared and must not be mutated.
+
+        Args:
+            path: Path to the YAML file
+            mtime_ns: File modification time, part of the cache key only
+            size: File size in bytes, part of the cache key only
+
+        Returns:
+            Parsed configuration dictionary
+        """
+        return YAMLConfigProvider._parse_yaml(path)
+
     def _merge_config(self, base: dict[str, Any], override: dict[str, Any]) -> None:
         """Recursively merge override config into base config.
 
@@ -96,16 +200,33 @@ class YAMLConfigProvider(ConfigProvider):
             >>> config.get("nonexistent.key", "fallback")
             "fallback"
         """
-        # Split key by dots for nested access
-        keys = key.split(".")
-        value = self._config
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def _lookup(self, key: str) -> Any:
+        """Resolve a dotted key, memoizing the result.
+
+        Args:
+            key: Configuration key (supports dot notation)
+
+        Returns:
+            Configuration value, or _MISSING if the key does not exist
+        """
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
 
-        for k in keys:
+        # Split key by dots for nested access
+        value: Any = self._config
+        for k in key.split("."):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                value = _MISSING
+                break
 
+        self._lookup_cache[key] = value
         return value
 
     def get_all(self) -> dict[str, Any]:
@@ -138,6 +259,9 @@ class YAMLConfigProvider(ConfigProvider):
 
         # Set the value
         config[keys[-1]] = value
+        self._lookup_cache.clear()
+        # Runtime values are dropped by the next reload
+        self._stamps = None
         logger.debug(f"Set config: {key} = {value}")
 
     def has(self, key: str) -> bool:
@@ -149,13 +273,4 @@ class YAMLConfigProvider(ConfigProvider):
         Returns:
             True if key exists, False otherwise
         """
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return False
-
-        return True
+        return self._lookup(key) is not _MISSING
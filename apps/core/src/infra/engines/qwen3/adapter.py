@@ -13,6 +13,17 @@ from domain.ports.tts_engine import EngineCapabilities, TTSEngine
 from .inference import Qwen3Inference
 from .model_loader import Qwen3ModelLoader
 
+# Qwen3-TTS limits are fixed, so one immutable instance is shared
+_CAPABILITIES = EngineCapabilities(
+    max_text_length=2048,  # Qwen3 token limit
+    recommended_text_length=400,  # Best quality range
+    supports_streaming=False,  # Not supported yet
+    supports_batching=True,  # generate_batch decodes texts together
+    min_sample_duration=3.0,  # Minimum seconds per sample
+    max_sample_duration=30.0,  # Maximum seconds per sample
+)
+_SUPPORTED_MODES = ("clone",)  # Only clone mode implemented for now
+
 
 class Qwen3Adapter(TTSEngine):
     """Qwen3-TTS implementation of TTSEngine port.
@@ -38,13 +49,7 @@ class Qwen3Adapter(TTSEngine):
         Returns:
             EngineCapabilities describing Qwen3-TTS limits
         """
-        return EngineCapabilities(
-            max_text_length=2048,  # Qwen3 token limit
-            recommended_text_length=400,  # Best quality range
-            supports_streaming=False,  # Not supported yet
-            min_sample_duration=3.0,  # Minimum seconds per sample
-            max_sample_duration=30.0,  # Maximum seconds per sample
-        )
+        return _CAPABILITIES
 
     def get_supported_modes(self) -> list[str]:
         """Get list of supported generation modes.
@@ -57,7 +62,7 @@ class Qwen3Adapter(TTSEngine):
         Returns:
             List of mode names
         """
-        return ["clone"]  # Only clone mode implemented for now
+        return list(_SUPPORTED_MODES)
 
     def generate_audio(
         self,
@@ -85,37 +90,10 @@ class Qwen3Adapter(TTSEngine):
         Raises:
             GenerationException: If generation fails
         """
-        # Validate mode
-        if mode not in self.get_supported_modes():
-            raise GenerationException(
-                f"Unsupported mode: {mode}. Supported modes: {self.get_supported_modes()}",
-                profile_id=profile.id,
-                text_length=len(text),
-            )
-
-        # Validate profile
-        if not self.validate_profile(profile):
-            raise GenerationException(
-                f"Invalid profile: {profile.id}",
-                profile_id=profile.id,
-                text_length=len(text),
-            )
-
-        # Ensure model is loaded
-        if not self._loaded:
-            if not self.model_loader.load_model():
-                raise GenerationException(
-                    "Failed to load Qwen3-TTS model",
-                    profile_id=profile.id,
-                    text_length=len(text),
-                )
-            self.inference = Qwen3Inference(self.model_loader, self.config)
-            self._loaded = True
+        inference = self._prepare(profile, mode, len(text))
 
         # Generate audio
         try:
-            assert self.inference is not None, "Inference engine not initialized"
-
             # Use first sample as reference (clone mode)
             if not profile.samples:
                 raise GenerationException(
@@ -127,7 +105,7 @@ class Qwen3Adapter(TTSEngine):
             ref_sample = profile.samples[0]
 
             # Generate
-            success = self.inference.generate_to_file(
+            success = inference.generate_to_file(
                 text=text,
                 ref_audio=ref_sample.path,
                 ref_text=profile.reference_text or "Reference audio sample",
@@ -153,6 +131,108 @@ class Qwen3Adapter(TTSEngine):
                 text_length=len(text),
             ) from e
 
+    def generate_batch(
+        self,
+        texts: list[str],
+        profile: VoiceProfile,
+        output_paths: list[Path],
+        mode: str = "clone",
+        **kwargs: Any,
+    ) -> list[Path]:
+        """Generate audio for several texts with one model call.
+
+        The reference prompt is encoded once and the texts are decoded
+        together, instead of one generate_audio call per text.
+
+        Args:
+            texts: Texts to convert to speech
+            profile: Voice profile to use for generation
+            output_paths: Where to save each generated audio, in text order
+            mode: Generation mode (default: "clone")
+            **kwargs: Additional parameters, as for generate_audio
+
+        Returns:
+            Paths to the generated audio files, in the order of texts
+
+        Raises:
+            GenerationException: If generation fails
+        """
+        text_length = sum(len(text) for text in texts)
+        inference = self._prepare(profile, mode, text_length)
+
+        try:
+            success = inference.generate_batch_to_files(
+                texts=texts,
+                ref_audio=profile.samples[0].path,
+                ref_text=profile.reference_text or "Reference audio sample",
+                output_paths=output_paths,
+                **kwargs,
+            )
+
+            if not success:
+                raise GenerationException(
+                    "Batch audio generation failed",
+                    profile_id=profile.id,
+                    text_length=text_length,
+                )
+
+            return list(output_paths)
+
+        except GenerationException:
+            raise
+        except Exception as e:
+            raise GenerationException(
+                f"Unexpected error during batch generation: {str(e)}",
+                profile_id=profile.id,
+                text_length=text_length,
+            ) from e
+
+    def _prepare(
+        self, profile: VoiceProfile, mode: str, text_length: int
+    ) -> Qwen3Inference:
+        """Validate a generation request and load the model if needed.
+
+        Args:
+            profile: Voice profile to use for generation
+            mode: Generation mode
+            text_length: Total length of the text to generate
+
+        Returns:
+            Inference engine for the loaded model
+
+        Raises:
+            GenerationException: If the request is invalid or loading fails
+        """
+        # Validate mode
+        if mode not in _SUPPORTED_MODES:
+            raise GenerationException(
+                f"Unsupported mode: {mode}. Supported modes: {list(_SUPPORTED_MODES)}",
+                profile_id=profile.id,
+                text_length=text_length,
+            )
+
+        # Validate profile
+        if not self.validate_profile(profile):
+            raise GenerationException(
+                f"Invalid profile: {profile.id}",
+                profile_id=profile.id,
+                text_length=text_length,
+            )
+
+        # Ensure model is loaded
+        if not self._loaded:
+            if not self.model_loader.load_model():
+                raise GenerationException(
+                    "Failed to load Qwen3-TTS model",
+                    profile_id=profile.id,
+                    text_length=text_length,
+                )
+            self.inference = Qwen3Inference(self.model_loader, self.config)
+            self._loaded = True
+
+        assert self.inference is not None, "Inference engine not initialized"
+        return self.inference
+
     def validate_profile(self, profile: VoiceProfile) -> bool:
         """Validate that a profile is compatible with Qwen3-TTS.
 
@@ -166,25 +246,29 @@ class Qwen3Adapter(TTSEngine):
         if not profile.samples:
             return False
 
-        # Check samples are valid
+        # Check sample duration (3-30 seconds recommended)
         for sample in profile.samples:
-            # Check sample file exists
-            if not sample.path.exists():
-                return False
-
-            # Check sample duration (3-30 seconds recommended)
-            if sample.duration < 3.0 or sample.duration > 30.0:
+            if not (
+                _CAPABILITIES.min_sample_duration
+                <= sample.duration
+                <= _CAPABILITIES.max_sample_duration
+            ):
                 return False
 
         # Check total duration (at least 10 seconds recommended)
         if profile.total_duration < 10.0:
             return False
 
-        return True
+        # Check sample files exist last: these are the only checks that
+        # touch the filesystem, so rejected profiles cost no syscalls
+        return all(sample.path.exists() for sample in profile.samples)
 
     def unload_model(self) -> None:
         """Unload model and free memory."""
         if self._loaded:
+            if self.inference is not None:
+                # Cached prompts hold tensors from the model being unloaded
+                self.inference.clear_prompt_cache()
             self.model_loader.unload_model()
             self.inference = None
             self._loaded = False
@@ -46,20 +46,15 @@ def merge_config(user_config: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Merged configuration
     """
-    default = get_default_config()
 
-    # Deep merge
-    def deep_merge(base: dict, override: dict) -> dict:
-        result = base.copy()
+    # Deep merge into a fresh defaults dict, so no level needs copying
+    def deep_merge(base: dict, override: dict) -> None:
         for key, value in override.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = deep_merge(result[key], value)
+            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
+                deep_merge(base[key], value)
             else:
-                result[key] = value
-        return result
+                base[key] = value
 
-    return deep_merge(default, user_config)
+    config = get_default_config()
+    deep_merge(config, user_config)
+    return config
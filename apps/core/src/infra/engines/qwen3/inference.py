@@ -29,12 +29,17 @@ class Qwen3Inference:
         """
         self.model_loader = model_loader
         self.config = config
-        self.language = config.get("generation", {}).get("language", "Spanish")
-        self.max_new_tokens = config.get("generation", {}).get("max_new_tokens", 2048)
+        generation = config.get("generation", {})
+        self.language = generation.get("language", "Spanish")
+        self.max_new_tokens = generation.get("max_new_tokens", 2048)
 
         # Initialize clone mode
         self.clone_mode = CloneMode(model_loader, config)
 
+    def clear_prompt_cache(self) -> None:
+        """Drop reference prompts cached for the current model."""
+        self.clone_mode.clear_prompt_cache()
+
     def generate(
         self,
         text: str,
@@ -76,6 +81,9 @@ class Qwen3Inference:
     ) -> list[tuple[np.ndarray, int]]:
         """Generate multiple audio files with same voice.
 
+        All texts are generated in a single model call, so the reference
+        audio is only encoded once.
+
         Args:
             texts: List of texts to generate
             ref_audio: Path to reference audio file
@@ -85,17 +93,10 @@ class Qwen3Inference:
         Returns:
             List of (audio_array, sample_rate) tuples
         """
-        results = []
-
-        for text in texts:
-            result = self.generate(text, ref_audio, ref_text, **kwargs)
-
-            if result is None:
-                continue
-
-            results.append(result)
-
-        return results
+        try:
+            return self.clone_mode.generate_batch(texts, ref_audio, ref_text, **kwargs)
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
 
     def generate_to_file(
         self,
@@ -144,3 +145,58 @@ class Qwen3Inference:
 
         except Exception as e:
             raise RuntimeError(f"Generation failed: {str(e)}") from e
+
+    def generate_batch_to_files(
+        self,
+        texts: list[str],
+        ref_audio: str | Path,
+        ref_text: str,
+        output_paths: list[Path],
+        language: str | None = None,
+        max_new_tokens: int | None = None,
+    ) -> bool:
+        """Generate speech for several texts in one call and save each one.
+
+        Args:
+            texts: Texts to convert to speech
+            ref_audio: Path to reference audio file
+            ref_text: Transcript of reference audio
+            output_paths: Paths to save the generated audio, in text order
+            language: Language for generation (default: from config)
+            max_new_tokens: Maximum tokens to generate (default: from config)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if len(texts) != len(output_paths):
+            raise ValueError("Expected one output path per text")
+
+        # Validate inputs using clone mode
+        for text in texts:
+            self.clone_mode.validate_inputs(text, ref_audio, ref_text)
+
+        if not self.model_loader.is_loaded():
+            raise RuntimeError("Model not loaded")
+
+        try:
+            results = self.generate_batch(
+                texts,
+                ref_audio,
+                ref_text,
+                language=language,
+                max_new_tokens=max_new_tokens,
+            )
+
+            if len(results) != len(texts):
+                return False
+
+            for (audio, sample_rate), output_path in zip(
+                results, output_paths, strict=True
+            ):
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                sf.write(output_path, audio, sample_rate)
+
+            return True
+
+        except Exception as e:
+            raise RuntimeError(f"Generation failed: {str(e)}") from e
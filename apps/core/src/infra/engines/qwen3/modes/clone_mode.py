@@ -3,6 +3,7 @@
 Voice cloning mode uses reference audio samples to clone a voice.
 """
 
+import weakref
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,9 @@ import numpy as np
 
 from ..model_loader import Qwen3ModelLoader
 
+# Reference prompts kept per CloneMode; a profile only has one reference
+_PROMPT_CACHE_SIZE = 8
+
 
 class CloneMode:
     """Voice cloning mode implementation.
@@ -27,8 +31,54 @@ class CloneMode:
         """
         self.model_loader = model_loader
         self.config = config
-        self.language = config.get("generation", {}).get("language", "Spanish")
-        self.max_new_tokens = config.get("generation", {}).get("max_new_tokens", 2048)
+        generation = config.get("generation", {})
+        self.language = generation.get("language", "Spanish")
+        self.max_new_tokens = generation.get("max_new_tokens", 2048)
+        # Encoded reference prompts keyed by file stat and transcript, valid
+        # for the model instance referenced by _prompt_model only
+        self._prompt_cache: dict[tuple[Any, ...], Any] = {}
+        self._prompt_model: weakref.ref[Any] | None = None
+
+    def clear_prompt_cache(self) -> None:
+        """Drop cached reference prompts and the tensors they hold."""
+        self._prompt_cache.clear()
+        self._prompt_model = None
+
+    def _get_prompt(self, model: Any, ref_audio: str | Path, ref_text: str) -> Any:
+        """Get the voice clone prompt for a reference, encoding it once.
+
+        Generating many clips from one profile would otherwise reload and
+        re-encode the same reference audio on every call. Keys include the
+        file's mtime and size, so an edited reference is encoded again, and
+        the cache is dropped when the model instance changes.
+
+        Args:
+            model: Loaded Qwen3-TTS model
+            ref_audio: Path to reference audio file
+            ref_text: Transcript of reference audio
+
+        Returns:
+            Prompt to pass as voice_clone_prompt
+        """
+        # Prompts encoded by a previous (unloaded) model must not be reused
+        if self._prompt_model is None or self._prompt_model() is not model:
+            self.clear_prompt_cache()
+            self._prompt_model = weakref.ref(model)
+
+        ref_audio_str = str(ref_audio)
+        stat = Path(ref_audio_str).stat()
+        key = (ref_audio_str, stat.st_mtime_ns, stat.st_size, ref_text)
+
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            prompt = model.create_voice_clone_prompt(
+                ref_audio=ref_audio_str, ref_text=ref_text
+            )
+            if len(self._prompt_cache) >= _PROMPT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._prompt_cache[next(iter(self._prompt_cache))]
+            self._prompt_cache[key] = prompt
+        return prompt
 
     def generate(
         self,
@@ -68,15 +118,11 @@ class CloneMode:
             if max_new_tokens is None:
                 max_new_tokens = self.max_new_tokens
 
-            # Convert ref_audio to string
-            ref_audio_str = str(ref_audio)
-
             # Generate using Qwen3-TTS voice cloning
             audio, sample_rate = model.generate_voice_clone(
                 text=text,
                 language=language,
-                ref_audio=ref_audio_str,
-                ref_text=ref_text,
+                voice_clone_prompt=self._get_prompt(model, ref_audio, ref_text),
                 max_new_tokens=max_new_tokens,
             )
 
@@ -85,6 +131,62 @@ class CloneMode:
         except Exception as e:
             raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
 
+    def generate_batch(
+        self,
+        texts: list[str],
+        ref_audio: str | Path,
+        ref_text: str,
+        language: str | None = None,
+        max_new_tokens: int | None = None,
+    ) -> list[tuple[np.ndarray, int]]:
+        """Generate audio for several texts with one voice cloning call.
+
+        The model accepts a list of texts, so the texts are decoded together
+        as a batch against one reference prompt.
+
+        Args:
+            texts: Texts to convert to speech
+            ref_audio: Path to reference audio file
+            ref_text: Transcript of reference audio
+            language: Language for generation (default: from config)
+            max_new_tokens: Maximum tokens to generate (default: from config)
+
+        Returns:
+            List of (audio_array, sample_rate) tuples, in the order of texts
+
+        Raises:
+            RuntimeError: If model is not loaded or generation fails
+        """
+        if not self.model_loader.is_loaded():
+            raise RuntimeError(
+                "Model not loaded. Call model_loader.load_model() first."
+            )
+
+        if not texts:
+            return []
+
+        try:
+            model = self.model_loader.get_model()
+            assert model is not None, "Model is None"
+
+            # Use config defaults if not specified
+            if language is None:
+                language = self.language
+            if max_new_tokens is None:
+                max_new_tokens = self.max_new_tokens
+
+            wavs, sample_rate = model.generate_voice_clone(
+                text=list(texts),
+                language=[language] * len(texts),
+                voice_clone_prompt=self._get_prompt(model, ref_audio, ref_text),
+                max_new_tokens=max_new_tokens,
+            )
+
+            return [(wav, sample_rate) for wav in wavs]
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
+
     def validate_inputs(self, text: str, ref_audio: str | Path, ref_text: str) -> None:
         """Validate inputs for clone mode generation.
 
@@ -97,11 +199,11 @@ class CloneMode:
             ValueError: If inputs are invalid
             FileNotFoundError: If reference audio doesn't exist
         """
-        if not text or len(text.strip()) == 0:
+        if not text or text.isspace():
             raise ValueError("Text cannot be empty")
 
         if not Path(ref_audio).exists():
             raise FileNotFoundError(f"Reference audio not found: {ref_audio}")
 
-        if not ref_text or len(ref_text.strip()) == 0:
+        if not ref_text or ref_text.isspace():
             raise ValueError("Reference text cannot be empty")
@@ -8,6 +8,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import msgspec
+
 from domain.models.audio_sample import AudioSample  # type: ignore[import-untyped]
 from domain.models.voice_profile import VoiceProfile  # type: ignore[import-untyped]
 
@@ -113,7 +115,7 @@ class JSONSerializer:
 
         Raises:
             ValueError: If JSON is invalid or data is malformed
-            json.JSONDecodeError: If JSON parsing fails
+                (msgspec.DecodeError is a ValueError)
         """
-        data = json.loads(json_string)
+        data = msgspec.json.decode(json_string)
         return JSONSerializer.deserialize(data)
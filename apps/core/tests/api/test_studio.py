@@ -4,10 +4,14 @@ Tests the main API entry point with real adapters (integration tests).
 """
 
 import json
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 
-from api import TTSStudio
+from api import TTSStudio, get_studio
+from api.studio import _cached_studio
 
 
 @pytest.fixture
@@ -54,6 +58,83 @@ class TestTTSStudioInitialization:
         """Test get_config with default value."""
         assert studio.get_config("nonexistent.key", "default") == "default"
 
+    def test_tts_engine_is_created_lazily(self, studio):
+        """Test that the TTS engine is only built when first needed."""
+        assert studio._tts_engine_instance is None
+
+        studio.list_voice_profiles()
+        assert studio._tts_engine_instance is None
+
+        engine = studio._tts_engine
+        assert engine is studio._tts_engine
+        assert studio._tts_engine_instance is engine
+
+
+class TestLazyImports:
+    """Test that importing the API stays cheap."""
+
+    def test_import_does_not_load_heavy_adapters(self):
+        """Test that importing api.studio does not pull in torch/librosa."""
+        src_dir = Path(__file__).parent.parent.parent / "src"
+        code = (
+            "import sys; import api.studio; "
+            "heavy = {'torch', 'librosa', 'infra.engines.qwen3.adapter'}; "
+            "print(sorted(heavy & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=src_dir,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_package_import_defers_studio_module(self):
+        """Test that importing the api package does not import api.studio."""
+        src_dir = Path(__file__).parent.parent.parent / "src"
+        code = (
+            "import sys; import api; "
+            "loaded = 'api.studio' in sys.modules; "
+            "cls = api.TTSStudio; "
+            "print(loaded, cls.__name__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=src_dir,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False TTSStudio"
+
+
+class TestGetStudio:
+    """Test the shared get_studio() accessor."""
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        """Create a user config file pointing at temporary paths."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            f"paths:\n  profiles: {tmp_path / 'profiles'}\n", encoding="utf-8"
+        )
+        _cached_studio.cache_clear()
+        yield config_path
+        _cached_studio.cache_clear()
+
+    def test_returns_same_instance_for_same_config(self, config_file):
+        """Test that repeated calls share one studio instance."""
+        first = get_studio(config_file)
+        second = get_studio(str(config_file))
+
+        assert first is second
+        assert first.get_config("paths.profiles") == str(
+            config_file.parent / "profiles"
+        )
+
 
 class TestCreateVoiceProfile:
     """Test create_voice_profile method."""
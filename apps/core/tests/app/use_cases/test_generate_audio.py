@@ -1,7 +1,7 @@
 """Tests for GenerateAudioUseCase."""
 
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -166,6 +166,25 @@ def test_generate_audio_auto_output_path(use_case, mock_tts_engine):
     assert "output_test_profile" in str(call_kwargs["output_path"])
 
 
+def test_generate_audio_auto_output_paths_are_unique(use_case, mock_tts_engine):
+    """Test that two generations in the same second get distinct paths."""
+    # Arrange
+    request = GenerationRequestDTO(profile_id="test_profile", text="Hello world")
+
+    # Act
+    with patch("app.use_cases.generate_audio.time.time", return_value=1000.0):
+        use_case.execute(request)
+        use_case.execute(request)
+
+    # Assert
+    first, second = (
+        call.kwargs["output_path"]
+        for call in mock_tts_engine.generate_audio.call_args_list
+    )
+    assert first.name.startswith("output_test_profile_1000_")
+    assert first != second
+
+
 def test_generate_audio_generation_exception(use_case, mock_tts_engine):
     """Test handling of generation exception."""
     # Arrange
@@ -238,3 +257,31 @@ def test_generate_audio_timing_metrics(use_case):
     # Assert
     assert result.generation_time > 0
     assert isinstance(result.generation_time, float)
+
+
+def test_generation_result_factories_match_constructor():
+    """Test that the result factories set every field like __init__ does."""
+    # Act
+    success = GenerationResultDTO.success_result(
+        output_path=Path("out.wav"),
+        duration=1.5,
+        profile_id="test_profile",
+        text_length=5,
+        generation_time=0.2,
+        seed=7,
+    )
+    error = GenerationResultDTO.error_result("boom", profile_id="test_profile")
+
+    # Assert
+    assert success == GenerationResultDTO(
+        success=True,
+        output_path=Path("out.wav"),
+        duration=1.5,
+        profile_id="test_profile",
+        text_length=5,
+        generation_time=0.2,
+        metadata={"seed": 7},
+    )
+    assert error == GenerationResultDTO(
+        success=False, error="boom", profile_id="test_profile"
+    )
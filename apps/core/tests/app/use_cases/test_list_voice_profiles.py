@@ -195,3 +195,19 @@ def test_list_voice_profiles_exception_handling(use_case, mock_profile_repositor
     # Act & Assert
     with pytest.raises(RuntimeError, match="Repository error"):
         use_case.execute()
+
+
+def test_list_voice_profiles_iter_is_lazy(
+    use_case, mock_profile_repository, sample_profiles
+):
+    """Test that iter() yields DTOs in repository order."""
+    # Arrange
+    mock_profile_repository.list_all.return_value = sample_profiles
+
+    # Act
+    profiles = use_case.iter()
+
+    # Assert
+    mock_profile_repository.list_all.assert_not_called()
+    assert [dto.id for dto in profiles] == ["profile1", "profile2"]
+    mock_profile_repository.list_all.assert_called_once()
@@ -1,8 +1,10 @@
 """Tests for ProcessBatchUseCase."""
 
+import logging
 from pathlib import Path
 from unittest.mock import Mock
 
+import msgspec
 import pytest
 
 from app.dto.batch_dto import BatchRequestDTO, BatchResultDTO, BatchSegment
@@ -10,13 +12,16 @@ from app.use_cases.process_batch import ProcessBatchUseCase
 from domain.models.audio_sample import AudioSample
 from domain.models.voice_profile import VoiceProfile
 from domain.ports.profile_repository import ProfileRepository
-from domain.ports.tts_engine import TTSEngine
+from domain.ports.tts_engine import EngineCapabilities, TTSEngine
 
 
 @pytest.fixture
 def mock_tts_engine():
     """Create a mock TTS engine."""
     engine = Mock(spec=TTSEngine)
+    engine.get_capabilities.return_value = EngineCapabilities(
+        max_text_length=2048, recommended_text_length=400
+    )
     engine.validate_profile.return_value = True
     engine.generate_audio.return_value = Path("output.wav")
     return engine
@@ -317,3 +322,206 @@ def test_batch_segment_dataclass():
     # Assert
     assert segment.id == "seg1"
     assert segment.text == "Hello world"
+
+
+def test_batch_request_dict_round_trip():
+    """Test BatchRequestDTO conversion to and from a dictionary."""
+    # Arrange
+    data = {
+        "profile_id": "test_profile",
+        "segments": [
+            {"id": "seg1", "text": "Hello", "metadata": {"speaker": "a"}},
+            {"id": "seg2", "text": "World"},
+        ],
+        "output_dir": "/tmp/batch",
+        "temperature": 1,
+    }
+
+    # Act
+    request = BatchRequestDTO.from_dict(data)
+
+    # Assert
+    assert request.output_dir == Path("/tmp/batch")
+    assert request.temperature == 1.0
+    assert request.segments[1].metadata == {}
+    assert request.to_dict() == {
+        "profile_id": "test_profile",
+        "segments": [
+            {"id": "seg1", "text": "Hello", "metadata": {"speaker": "a"}},
+            {"id": "seg2", "text": "World", "metadata": {}},
+        ],
+        "output_dir": "/tmp/batch",
+        "temperature": 1.0,
+        "speed": 1.0,
+        "language": "es",
+        "mode": "clone",
+        "metadata": {},
+    }
+
+
+def test_batch_request_from_dict_accepts_int_segment_ids():
+    """Test that numeric segment ids keep working and name output files."""
+    data = {
+        "profile_id": "test_profile",
+        "segments": [{"id": 1, "text": "Hello"}],
+        "output_dir": "/tmp/batch",
+    }
+
+    request = BatchRequestDTO.from_dict(data)
+
+    assert request.segments[0].id == 1
+    assert request.to_generation_requests()[0].output_path == Path("/tmp/batch/1.wav")
+
+
+def test_batch_request_from_dict_rejects_numeric_strings():
+    """Test that numeric fields are not coerced from strings."""
+    data = {
+        "profile_id": "test_profile",
+        "segments": [{"id": "seg1", "text": "Hello"}],
+        "output_dir": "/tmp/batch",
+        "temperature": "0.5",
+    }
+
+    with pytest.raises(msgspec.ValidationError):
+        BatchRequestDTO.from_dict(data)
+
+
+def test_process_batch_loads_profile_once(
+    use_case, mock_tts_engine, mock_profile_repository
+):
+    """Test that the shared profile is loaded and validated once per batch."""
+    # Arrange
+    segments = [BatchSegment(id=f"seg{i}", text=f"Text {i}") for i in range(5)]
+    request = BatchRequestDTO(
+        profile_id="test_profile",
+        segments=segments,
+        output_dir=Path("/tmp/batch_output"),
+    )
+
+    # Act
+    result = use_case.execute(request)
+
+    # Assert
+    assert result.successful_segments == 5
+    mock_profile_repository.find_by_id.assert_called_once_with("test_profile")
+    mock_tts_engine.validate_profile.assert_called_once()
+
+
+def test_process_batch_profile_not_found(use_case, mock_profile_repository):
+    """Test that a missing profile fails every segment."""
+    # Arrange
+    mock_profile_repository.find_by_id.return_value = None
+    request = BatchRequestDTO(
+        profile_id="missing",
+        segments=[BatchSegment(id="seg1", text="Hello")],
+        output_dir=Path("/tmp/batch_output"),
+    )
+
+    # Act
+    result = use_case.execute(request)
+
+    # Assert
+    assert result.failed_segments == 1
+    assert "Profile not found: missing" in result.results[0].error
+
+
+def test_process_batch_logs_unexpected_repository_errors(
+    use_case, mock_profile_repository, caplog
+):
+    """Test that unexpected repository errors are logged, not swallowed."""
+    # Arrange
+    mock_profile_repository.find_by_id.side_effect = RuntimeError("db down")
+    request = BatchRequestDTO(
+        profile_id="test_profile",
+        segments=[BatchSegment(id="seg1", text="Hello")],
+        output_dir=Path("/tmp/batch_output"),
+    )
+
+    # Act
+    with caplog.at_level(logging.ERROR, logger="app.use_cases.process_batch"):
+        result = use_case.execute(request)
+
+    # Assert
+    assert result.failed_segments == 1
+    assert "Unexpected error preloading profile test_profile" in caplog.text
+
+
+def test_process_batch_uses_engine_batching(use_case, mock_tts_engine):
+    """Test that batching engines get every segment in a single call."""
+    # Arrange
+    mock_tts_engine.get_capabilities.return_value = EngineCapabilities(
+        max_text_length=2048, recommended_text_length=400, supports_batching=True
+    )
+    mock_tts_engine.generate_batch.side_effect = (
+        lambda texts, profile, output_paths, **kwargs: list(output_paths)
+    )
+    segments = [BatchSegment(id=f"seg{i}", text=f"Text {i}") for i in range(3)]
+    request = BatchRequestDTO(
+        profile_id="test_profile",
+        segments=segments,
+        output_dir=Path("/tmp/batch_output"),
+        language="en",
+    )
+
+    # Act
+    result = use_case.execute(request)
+
+    # Assert
+    assert result.successful_segments == 3
+    assert [r.output_path.stem for r in result.results] == ["seg0", "seg1", "seg2"]
+    mock_tts_engine.generate_audio.assert_not_called()
+    call_kwargs = mock_tts_engine.generate_batch.call_args.kwargs
+    assert call_kwargs["texts"] == ["Text 0", "Text 1", "Text 2"]
+    assert call_kwargs["language"] == "en"
+
+
+def test_process_batch_falls_back_when_batch_call_fails(use_case, mock_tts_engine):
+    """Test that a failed batch call is retried segment by segment."""
+    from domain.exceptions import GenerationException
+
+    # Arrange
+    mock_tts_engine.get_capabilities.return_value = EngineCapabilities(
+        max_text_length=2048, recommended_text_length=400, supports_batching=True
+    )
+    mock_tts_engine.generate_batch.side_effect = GenerationException("Out of memory")
+    request = BatchRequestDTO(
+        profile_id="test_profile",
+        segments=[
+            BatchSegment(id="seg1", text="Hello"),
+            BatchSegment(id="seg2", text="Hi"),
+        ],
+        output_dir=Path("/tmp/batch_output"),
+    )
+
+    # Act
+    result = use_case.execute(request)
+
+    # Assert
+    assert result.successful_segments == 2
+    assert mock_tts_engine.generate_audio.call_count == 2
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_process_batch_workers_preserve_order(
+    mock_tts_engine, mock_profile_repository, max_workers
+):
+    """Test that concurrent processing keeps results in segment order."""
+    # Arrange
+    use_case = ProcessBatchUseCase(
+        tts_engine=mock_tts_engine,
+        profile_repository=mock_profile_repository,
+        max_workers=max_workers,
+    )
+    mock_tts_engine.generate_audio.side_effect = lambda **kwargs: kwargs["output_path"]
+    segments = [BatchSegment(id=f"seg{i}", text=f"Text {i}") for i in range(8)]
+    request = BatchRequestDTO(
+        profile_id="test_profile",
+        segments=segments,
+        output_dir=Path("/tmp/batch_output"),
+    )
+
+    # Act
+    result = use_case.execute(request)
+
+    # Assert
+    assert [r.output_path.stem for r in result.results] == [f"seg{i}" for i in range(8)]
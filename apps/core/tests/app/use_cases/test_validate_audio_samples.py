@@ -1,7 +1,7 @@
 """Tests for ValidateAudioSamplesUseCase."""
 
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -304,3 +304,67 @@ def test_validation_summary_dataclass():
     assert summary.invalid_samples == 1
     assert summary.all_valid is False
     assert len(summary.results) == 2
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_validate_audio_samples_workers_preserve_order(
+    mock_audio_processor, max_workers
+):
+    """Test that results keep input order regardless of worker count."""
+    # Arrange
+    from domain.models.audio_sample import AudioSample
+
+    sample_paths = [Path(f"sample{i}.wav") for i in range(6)]
+    mock_audio_processor.process_sample.side_effect = lambda path: AudioSample(
+        path=path,
+        duration=5.0,
+        sample_rate=12000,
+        channels=1,
+        bit_depth=16,
+    )
+    use_case = ValidateAudioSamplesUseCase(
+        audio_processor=mock_audio_processor, max_workers=max_workers
+    )
+
+    # Act
+    summary = use_case.execute(sample_paths)
+
+    # Assert
+    assert [r.path for r in summary.results] == sample_paths
+    assert summary.valid_samples == 6
+    assert summary.total_duration == 30.0
+
+
+@pytest.mark.parametrize("cpus, expected", [(2, 2), (64, 8)])
+def test_default_workers_follow_cpu_affinity(mock_audio_processor, cpus, expected):
+    """Test that the default pool size is capped by the usable CPUs."""
+    with patch(
+        "app.use_cases._workers.os.sched_getaffinity",
+        create=True,
+        return_value=set(range(cpus)),
+    ):
+        use_case = ValidateAudioSamplesUseCase(audio_processor=mock_audio_processor)
+
+    assert use_case._max_workers == expected
+
+
+def test_sample_validation_result_to_dict():
+    """Test SampleValidationResult serialization."""
+    result = SampleValidationResult(
+        path=Path("test.wav"),
+        valid=True,
+        duration=5.0,
+        sample_rate=12000,
+        channels=1,
+        bit_depth=16,
+    )
+
+    assert result.to_dict() == {
+        "path": "test.wav",
+        "valid": True,
+        "error": None,
+        "duration": 5.0,
+        "sample_rate": 12000,
+        "channels": 1,
+        "bit_depth": 16,
+    }
@@ -174,6 +174,23 @@ class TestVoiceProfileValidation:
         errors = profile.validation_errors()
         assert any("Maximum is 300 seconds" in err for err in errors)
 
+    def test_validation_errors_reports_every_broken_rule(self, valid_sample):
+        """Test that all failures are listed in rule order."""
+        profile = VoiceProfile(
+            id="test-id",
+            name="  ",
+            samples=[valid_sample] * 11,
+            created_at=datetime.now(),
+        )
+
+        errors = profile.validation_errors()
+
+        assert not profile.is_valid()
+        assert errors == [
+            "Profile has 11 samples. Maximum is 10 samples.",
+            "Profile name cannot be empty",
+        ]
+
 
 class TestVoiceProfileMethods:
     """Test voice profile methods."""
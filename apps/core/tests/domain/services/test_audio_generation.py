@@ -343,3 +343,57 @@ class TestServiceDependencies:
         mock_tts_engine.get_supported_modes.assert_called()
         mock_tts_engine.validate_profile.assert_called_once_with(valid_profile)
         mock_tts_engine.generate_audio.assert_called_once()
+
+    def test_engine_capabilities_and_modes_are_queried_once(
+        self, audio_generation_service, mock_tts_engine, valid_profile
+    ):
+        """Test that static engine metadata is cached across generations."""
+        mock_tts_engine.get_supported_modes.return_value = ["clone", "custom"]
+        mock_tts_engine.generate_audio.return_value = Path("output.wav")
+
+        for mode in ("clone", "custom", "clone"):
+            audio_generation_service.generate_with_profile(
+                text="Test text",
+                profile=valid_profile,
+                output_path=Path("output.wav"),
+                mode=mode,
+            )
+
+        mock_tts_engine.get_capabilities.assert_called_once()
+        mock_tts_engine.get_supported_modes.assert_called_once()
+
+    def test_refresh_engine_info_queries_engine_again(
+        self, audio_generation_service, mock_tts_engine, valid_profile
+    ):
+        """Test that refreshing picks up changed engine metadata."""
+        mock_tts_engine.generate_audio.return_value = Path("output.wav")
+        audio_generation_service.generate_with_profile(
+            text="Test text", profile=valid_profile, output_path=Path("output.wav")
+        )
+
+        # The engine is reloaded with a new mode
+        mock_tts_engine.get_supported_modes.return_value = ["clone", "custom"]
+        audio_generation_service.refresh_engine_info()
+        audio_generation_service.generate_with_profile(
+            text="Test text",
+            profile=valid_profile,
+            output_path=Path("output.wav"),
+            mode="custom",
+        )
+
+        assert mock_tts_engine.get_capabilities.call_count == 2
+        assert mock_tts_engine.get_supported_modes.call_count == 2
+
+    def test_unsupported_mode_error_lists_modes_in_engine_order(
+        self, audio_generation_service, mock_tts_engine, valid_profile
+    ):
+        """Test that the error message keeps the engine's mode order."""
+        mock_tts_engine.get_supported_modes.return_value = ["clone", "custom"]
+
+        with pytest.raises(ValueError, match="Supported modes: clone, custom"):
+            audio_generation_service.generate_with_profile(
+                text="Test text",
+                profile=valid_profile,
+                output_path=Path("output.wav"),
+                mode="design",
+            )
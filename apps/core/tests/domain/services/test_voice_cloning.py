@@ -150,6 +150,50 @@ class TestCreateProfileFromSamples:
                 name="test_profile", sample_paths=[]
             )
 
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_create_profile_workers_preserve_sample_order(
+        self, mock_audio_processor, max_workers
+    ):
+        """Test that concurrent processing keeps samples in path order."""
+        service = VoiceCloningService(
+            audio_processor=mock_audio_processor, max_workers=max_workers
+        )
+        sample_paths = [Path(f"sample{i}.wav") for i in range(6)]
+        mock_audio_processor.validate_sample.return_value = True
+        mock_audio_processor.process_sample.side_effect = lambda path: AudioSample(
+            path=path,
+            duration=5.0,
+            sample_rate=12000,
+            channels=1,
+            bit_depth=16,
+        )
+
+        profile = service.create_profile_from_samples(
+            name="test_profile", sample_paths=sample_paths
+        )
+
+        assert [s.path for s in profile.samples] == sample_paths
+
+    def test_create_profile_concurrent_reports_first_invalid_sample(
+        self, mock_audio_processor
+    ):
+        """Test that concurrent validation fails on the first invalid path."""
+        service = VoiceCloningService(
+            audio_processor=mock_audio_processor, max_workers=4
+        )
+        sample_paths = [Path(f"sample{i}.wav") for i in range(4)]
+        invalid = {Path("sample1.wav"), Path("sample3.wav")}
+        mock_audio_processor.validate_sample.side_effect = lambda path: (
+            path not in invalid
+        )
+
+        with pytest.raises(ValueError, match="sample1.wav"):
+            service.create_profile_from_samples(
+                name="test_profile", sample_paths=sample_paths
+            )
+
+        mock_audio_processor.process_sample.assert_not_called()
+
 
 class TestValidateProfileForCloning:
     """Test validate_profile_for_cloning method."""
@@ -0,0 +1,107 @@
+"""Tests for AudioConverter.
+
+Tests ffmpeg command construction with subprocess mocked out.
+"""
+
+import logging
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from infra.audio.converter import FFMPEG_CMD, AudioConverter
+
+
+@pytest.fixture
+def converter():
+    """Create an AudioConverter with Qwen3-TTS defaults."""
+    return AudioConverter(sample_rate=12000, channels=1, bit_depth=16)
+
+
+def fake_ffmpeg(returncode=0):
+    """Build a subprocess.run stand-in that writes ffmpeg's output file."""
+
+    def run(cmd, **kwargs):
+        if returncode == 0:
+            with open(cmd[-1], "wb"):
+                pass
+        return Mock(returncode=returncode, stderr="boom")
+
+    return run
+
+
+class TestProcessPipeline:
+    """Test suite for AudioConverter.process_pipeline."""
+
+    @patch("infra.audio.converter.subprocess.run")
+    def test_runs_ffmpeg_once_with_filter_chain(self, mock_run, converter, tmp_path):
+        """Test that all effects are applied in one ffmpeg invocation."""
+        input_path = tmp_path / "in.wav"
+        sf.write(input_path, np.zeros(12000 * 4), 12000, subtype="PCM_16")
+        mock_run.side_effect = fake_ffmpeg()
+        output_path = tmp_path / "out" / "sample.wav"
+
+        result = converter.process_pipeline(
+            input_path,
+            output_path,
+            remove_silence=True,
+            normalize_lufs=-16.0,
+            fade_in=0.5,
+            fade_out=1.0,
+        )
+
+        assert result is True
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert tuple(cmd[: len(FFMPEG_CMD)]) == FFMPEG_CMD
+        assert cmd[cmd.index("-af") + 1] == (
+            "afade=t=out:st=3.0:d=1.0,"
+            "silenceremove=start_periods=1:stop_periods=-1:detection=peak,"
+            "loudnorm=I=-16.0:TP=-1.5:LRA=11,"
+            "afade=t=in:st=0:d=0.5"
+        )
+        assert cmd[cmd.index("-ar") + 1] == "12000"
+        assert cmd[cmd.index("-ac") + 1] == "1"
+        assert cmd[-1] == str(output_path)
+
+    @patch("infra.audio.converter.subprocess.run")
+    def test_without_effects_only_converts(self, mock_run, converter, tmp_path):
+        """Test that no filter chain is passed when no effects are requested."""
+        mock_run.side_effect = fake_ffmpeg()
+
+        result = converter.process_pipeline(tmp_path / "in.wav", tmp_path / "o.wav")
+
+        assert result is True
+        assert "-af" not in mock_run.call_args[0][0]
+
+    @patch("infra.audio.converter.subprocess.run")
+    def test_ffmpeg_failure_returns_false(self, mock_run, converter, tmp_path, caplog):
+        """Test that a failing ffmpeg run is logged and reported as False."""
+        mock_run.side_effect = fake_ffmpeg(returncode=1)
+
+        with caplog.at_level(logging.ERROR, logger="infra.audio.converter"):
+            result = converter.process_pipeline(
+                tmp_path / "in.wav", tmp_path / "out.wav", fade_in=0.5
+            )
+
+        assert result is False
+        assert "FFmpeg error" in caplog.text
+
+
+class TestConvertToTargetFormat:
+    """Test suite for AudioConverter.convert_to_target_format."""
+
+    @patch("infra.audio.converter.subprocess.run")
+    def test_converts_through_pipeline(self, mock_run, converter, tmp_path):
+        """Test that conversion is a pipeline run without effects."""
+        mock_run.side_effect = fake_ffmpeg()
+        output_path = tmp_path / "out.wav"
+
+        result = converter.convert_to_target_format(tmp_path / "in.mp3", output_path)
+
+        assert result is True
+        cmd = mock_run.call_args[0][0]
+        assert "-af" not in cmd
+        assert cmd[cmd.index("-sample_fmt") + 1] == "s16"
+        assert cmd[-1] == str(output_path)
@@ -0,0 +1,58 @@
+"""Tests for AudioEffects.
+
+Tests ffmpeg command construction with subprocess mocked out.
+"""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import soundfile as sf
+
+from infra.audio.effects import AudioEffects
+
+
+def fake_ffmpeg(cmd, **kwargs):
+    """Stand-in for subprocess.run that writes ffmpeg's output file."""
+    with open(cmd[-1], "wb"):
+        pass
+    return Mock(returncode=0)
+
+
+class TestApplyFade:
+    """Test suite for AudioEffects.apply_fade."""
+
+    @patch("infra.audio.effects.subprocess.run")
+    def test_fade_out_starts_from_header_duration(self, mock_run, tmp_path):
+        """Test that the fade-out start is derived from the file duration."""
+        input_path = tmp_path / "in.wav"
+        sf.write(input_path, np.zeros(12000 * 4), 12000, subtype="PCM_16")
+        mock_run.side_effect = fake_ffmpeg
+
+        result = AudioEffects.apply_fade(
+            input_path, tmp_path / "out.wav", fade_in_duration=0.5
+        )
+
+        assert result is True
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-af") + 1] == (
+            "afade=t=in:st=0:d=0.5,afade=t=out:st=3.0:d=1.0"
+        )
+
+    @patch("infra.audio.effects.subprocess.run")
+    def test_falls_back_to_ffprobe_for_unsupported_formats(self, mock_run, tmp_path):
+        """Test that ffprobe supplies the duration when soundfile cannot."""
+        input_path = tmp_path / "in.m4a"
+        input_path.write_bytes(b"not readable by libsndfile")
+
+        def run(cmd, **kwargs):
+            if cmd[0] == "ffprobe":
+                return Mock(returncode=0, stdout="6.5\n")
+            return fake_ffmpeg(cmd)
+
+        mock_run.side_effect = run
+
+        result = AudioEffects.apply_fade(input_path, tmp_path / "out.wav")
+
+        assert result is True
+        ffmpeg_cmd = mock_run.call_args_list[-1][0][0]
+        assert "afade=t=out:st=5.5:d=1.0" in ffmpeg_cmd[ffmpeg_cmd.index("-af") + 1]
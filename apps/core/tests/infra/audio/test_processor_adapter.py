@@ -5,7 +5,9 @@ Tests the librosa-based audio processor adapter implementation.
 
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
+import soundfile as sf
 
 from domain.exceptions import InvalidSampleException
 from domain.models.audio_sample import AudioSample
@@ -100,12 +102,10 @@ class TestLibrosaAudioProcessor:
             processor.validate_sample(valid_audio_file)
 
     @patch("infra.audio.processor_adapter.AudioValidator")
-    @patch("infra.audio.processor_adapter.librosa")
     @patch("infra.audio.processor_adapter.sf")
     def test_process_sample_success(
         self,
         mock_sf,
-        mock_librosa,
         mock_validator_class,
         processor,
         valid_audio_file,
@@ -118,13 +118,10 @@ class TestLibrosaAudioProcessor:
         mock_validator.validate.return_value = mock_result
         mock_validator_class.return_value = mock_validator
 
-        # Setup mock librosa
-        mock_audio = Mock()
-        mock_librosa.load.return_value = (mock_audio, 12000)
-        mock_librosa.get_duration.return_value = 10.5
-
         # Setup mock soundfile
         mock_info = Mock()
+        mock_info.duration = 10.5
+        mock_info.samplerate = 12000
         mock_info.channels = 1
         mock_info.subtype = "PCM_16"
         mock_sf.info.return_value = mock_info
@@ -161,11 +158,11 @@ class TestLibrosaAudioProcessor:
             processor.process_sample(valid_audio_file)
 
     @patch("infra.audio.processor_adapter.AudioValidator")
-    @patch("infra.audio.processor_adapter.librosa")
+    @patch("infra.audio.processor_adapter.sf")
     def test_process_sample_load_error(
-        self, mock_librosa, mock_validator_class, processor, valid_audio_file
+        self, mock_sf, mock_validator_class, processor, valid_audio_file
     ):
-        """Test processing sample when librosa fails to load."""
+        """Test processing sample when the file header cannot be read."""
         # Setup mock validator
         mock_validator = Mock()
         mock_result = Mock()
@@ -173,8 +170,8 @@ class TestLibrosaAudioProcessor:
         mock_validator.validate.return_value = mock_result
         mock_validator_class.return_value = mock_validator
 
-        # Setup mock librosa to raise error
-        mock_librosa.load.side_effect = Exception("Failed to load audio")
+        # Setup mock soundfile to raise error
+        mock_sf.info.side_effect = Exception("Failed to read audio")
 
         # Create new processor to use mocked dependencies
         processor = LibrosaAudioProcessor()
@@ -183,12 +180,10 @@ class TestLibrosaAudioProcessor:
             processor.process_sample(valid_audio_file)
 
     @patch("infra.audio.processor_adapter.AudioValidator")
-    @patch("infra.audio.processor_adapter.librosa")
     @patch("infra.audio.processor_adapter.sf")
     def test_process_sample_extracts_bit_depth(
         self,
         mock_sf,
-        mock_librosa,
         mock_validator_class,
         processor,
         valid_audio_file,
@@ -201,13 +196,10 @@ class TestLibrosaAudioProcessor:
         mock_validator.validate.return_value = mock_result
         mock_validator_class.return_value = mock_validator
 
-        # Setup mock librosa
-        mock_audio = Mock()
-        mock_librosa.load.return_value = (mock_audio, 12000)
-        mock_librosa.get_duration.return_value = 10.0
-
         # Setup mock soundfile with 16-bit (valid)
         mock_info = Mock()
+        mock_info.duration = 10.0
+        mock_info.samplerate = 12000
         mock_info.channels = 1
         mock_info.subtype = "PCM_16"  # 16-bit audio (valid)
         mock_sf.info.return_value = mock_info
@@ -219,6 +211,52 @@ class TestLibrosaAudioProcessor:
 
         assert result.bit_depth == 16
 
+    @patch("infra.audio.processor_adapter.AudioValidator")
+    @patch("infra.audio.processor_adapter.sf")
+    def test_validate_then_process_validates_once(
+        self,
+        mock_sf,
+        mock_validator_class,
+        processor,
+        valid_audio_file,
+    ):
+        """Test that processing a just-validated file reuses the validation."""
+        # Setup mock validator
+        mock_validator = Mock()
+        mock_result = Mock()
+        mock_result.is_valid.return_value = True
+        mock_validator.validate.return_value = mock_result
+        mock_validator_class.return_value = mock_validator
+
+        # Setup mock soundfile
+        mock_info = Mock()
+        mock_info.duration = 10.0
+        mock_info.samplerate = 12000
+        mock_info.channels = 1
+        mock_info.subtype = "PCM_16"
+        mock_sf.info.return_value = mock_info
+
+        # Create new processor to use mocked dependencies
+        processor = LibrosaAudioProcessor()
+
+        processor.validate_sample(valid_audio_file)
+        processor.process_sample(valid_audio_file)
+
+        mock_validator.validate.assert_called_once_with(valid_audio_file)
+
+    def test_cached_validation_result_is_not_shared(self, processor, tmp_path):
+        """Test that callers cannot modify the cached validation result."""
+        path = tmp_path / "sample.wav"
+        sf.write(path, np.zeros(12000 * 5), 12000, subtype="PCM_16")
+
+        first = processor._validate(path)
+        first.errors.append("added by caller")
+        first.metadata.clear()
+        second = processor._validate(path)
+
+        assert second.errors == []
+        assert second.metadata
+
     @patch("infra.audio.processor_adapter.subprocess.run")
     def test_normalize_audio_success(self, mock_run, processor, tmp_path):
         """Test successful audio normalization."""
@@ -328,3 +366,23 @@ class TestLibrosaAudioProcessor:
 
         with pytest.raises(InvalidSampleException, match="normalization failed"):
             processor.normalize_audio(input_path, output_path)
+
+
+def test_process_sample_reads_bit_depth_from_subtype(tmp_path):
+    """Test that bit depth comes from the validator's subtype table."""
+    path = tmp_path / "sample.wav"
+    sf.write(path, np.zeros(12000 * 5), 12000, subtype="PCM_16")
+
+    result = LibrosaAudioProcessor().process_sample(path)
+
+    assert result.bit_depth == 16
+
+
+@pytest.mark.parametrize(("subtype", "bits"), [("PCM_24", 24), ("FLOAT", 32)])
+def test_process_sample_rejects_wide_subtypes(tmp_path, subtype, bits):
+    """Test that wide samples keep their real bit depth instead of 16."""
+    path = tmp_path / "sample.wav"
+    sf.write(path, np.zeros(12000 * 5), 12000, subtype=subtype)
+
+    with pytest.raises(InvalidSampleException, match=f"Invalid bit depth: {bits}"):
+        LibrosaAudioProcessor().process_sample(path)
@@ -0,0 +1,123 @@
+"""Tests for AudioValidator.
+
+Tests validation of real WAV files against Qwen3-TTS requirements.
+"""
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from infra.audio.validator import AudioValidator
+
+
+def write_wav(path, seconds=5.0, sample_rate=12000, channels=1, peak=0.5):
+    """Write a sine wave WAV file and return its path."""
+    frames = int(seconds * sample_rate)
+    t = np.arange(frames) / sample_rate
+    tone = peak * np.sin(2 * np.pi * 220 * t)
+    audio = np.column_stack([tone] * channels) if channels > 1 else tone
+    sf.write(path, audio, sample_rate, subtype="PCM_16")
+    return path
+
+
+@pytest.fixture
+def validator():
+    """Create an AudioValidator with Qwen3-TTS defaults."""
+    return AudioValidator(sample_rate=12000, channels=1, bit_depth=16)
+
+
+class TestAudioValidator:
+    """Test suite for AudioValidator."""
+
+    def test_valid_sample_passes(self, validator, tmp_path):
+        """Test that a clean mono 12kHz sample is valid."""
+        path = write_wav(tmp_path / "valid.wav")
+
+        result = validator.validate(path)
+
+        assert result.is_valid()
+        assert result.warnings == []
+        assert result.metadata["sample_rate"] == 12000
+        assert result.metadata["channels"] == 1
+        assert result.metadata["bit_depth"] == "PCM_16"
+        assert result.metadata["duration"] == pytest.approx(5.0)
+        assert result.metadata["max_amplitude"] == pytest.approx(0.5, abs=1e-3)
+
+    def test_stereo_sample_fails(self, validator, tmp_path):
+        """Test that a stereo sample is rejected."""
+        path = write_wav(tmp_path / "stereo.wav", channels=2)
+
+        result = validator.validate(path)
+
+        assert not result.is_valid()
+        assert result.metadata["channels"] == 2
+
+    def test_short_sample_fails(self, validator, tmp_path):
+        """Test that a sample shorter than 3 seconds is rejected."""
+        path = write_wav(tmp_path / "short.wav", seconds=2.0)
+
+        result = validator.validate(path)
+
+        assert not result.is_valid()
+        assert any("minimum: 3s" in error for error in result.errors)
+
+    def test_clipping_detected_past_first_block(self, validator, tmp_path):
+        """Test that clipping anywhere in the file is detected."""
+        path = tmp_path / "clipped.wav"
+        audio = np.full(12000 * 10, 0.1)
+        audio[-10:] = 1.0  # Clip only at the very end
+        sf.write(path, audio, 12000, subtype="PCM_16")
+
+        result = validator.validate(path)
+
+        assert not result.is_valid()
+        assert any("clipping" in error for error in result.errors)
+
+    def test_negative_clipping_detected(self, validator, tmp_path):
+        """Test that clipping on negative samples only is detected."""
+        path = tmp_path / "negative_clip.wav"
+        audio = np.full(12000 * 5, 0.1)
+        audio[100:110] = -1.0
+        sf.write(path, audio, 12000, subtype="PCM_16")
+
+        result = validator.validate(path)
+
+        assert not result.is_valid()
+        assert result.metadata["max_amplitude"] == pytest.approx(1.0, abs=1e-3)
+
+    def test_sample_rate_mismatch_warns(self, validator, tmp_path):
+        """Test that a non-12kHz sample only produces a warning."""
+        path = write_wav(tmp_path / "hires.wav", sample_rate=24000)
+
+        result = validator.validate(path)
+
+        assert result.is_valid()
+        assert any("24000 Hz" in warning for warning in result.warnings)
+
+    @pytest.mark.parametrize("subtype", ["PCM_24", "FLOAT"])
+    def test_non_16_bit_subtype_warns(self, validator, tmp_path, subtype):
+        """Test that samples that are not 16-bit PCM only produce a warning."""
+        path = tmp_path / "wide.wav"
+        sf.write(path, np.zeros(12000 * 5), 12000, subtype=subtype)
+
+        result = validator.validate(path)
+
+        assert result.is_valid()
+        assert result.warnings == [f"Bit depth is {subtype} (recommended: 16-bit PCM)"]
+
+    def test_missing_file_fails(self, validator, tmp_path):
+        """Test that a missing file is reported as not found."""
+        result = validator.validate(tmp_path / "missing.wav")
+
+        assert not result.is_valid()
+        assert "No such file or directory" in result.errors[0]
+
+    def test_unreadable_file_fails(self, validator, tmp_path):
+        """Test that a file that is not audio is reported as invalid."""
+        path = tmp_path / "not_audio.wav"
+        path.write_text("not audio", encoding="utf-8")
+
+        result = validator.validate(path)
+
+        assert not result.is_valid()
+        assert result.errors[0].startswith("Failed to validate audio")
@@ -75,6 +75,7 @@ class TestQwen3Adapter:
         assert capabilities.max_text_length == 2048
         assert capabilities.recommended_text_length == 400
         assert capabilities.supports_streaming is False
+        assert capabilities.supports_batching is True
         assert capabilities.min_sample_duration == 3.0
         assert capabilities.max_sample_duration == 30.0
 
@@ -343,6 +344,76 @@ class TestQwen3Adapter:
                 output_path=output_path,
             )
 
+    @patch("infra.engines.qwen3.adapter.Qwen3ModelLoader")
+    @patch("infra.engines.qwen3.adapter.Qwen3Inference")
+    def test_generate_batch_success(
+        self,
+        mock_inference_class,
+        mock_loader_class,
+        qwen3_config,
+        sample_profile,
+        tmp_path,
+    ):
+        """Test that a batch is generated with one inference call."""
+        # Setup mocks
+        mock_loader = Mock()
+        mock_loader.load_model.return_value = True
+        mock_loader_class.return_value = mock_loader
+
+        mock_inference = Mock()
+        mock_inference.generate_batch_to_files.return_value = True
+        mock_inference_class.return_value = mock_inference
+
+        adapter = Qwen3Adapter(qwen3_config)
+        output_paths = [tmp_path / "seg1.wav", tmp_path / "seg2.wav"]
+
+        # Generate audio
+        result = adapter.generate_batch(
+            texts=["First text", "Second text"],
+            profile=sample_profile,
+            output_paths=output_paths,
+            language="Spanish",
+        )
+
+        # Verify
+        assert result == output_paths
+        mock_loader.load_model.assert_called_once()
+        mock_inference.generate_batch_to_files.assert_called_once()
+        call_kwargs = mock_inference.generate_batch_to_files.call_args.kwargs
+        assert call_kwargs["texts"] == ["First text", "Second text"]
+        assert call_kwargs["ref_audio"] == sample_profile.samples[0].path
+        assert call_kwargs["language"] == "Spanish"
+        mock_inference.generate_to_file.assert_not_called()
+
+    @patch("infra.engines.qwen3.adapter.Qwen3ModelLoader")
+    @patch("infra.engines.qwen3.adapter.Qwen3Inference")
+    def test_generate_batch_failure(
+        self,
+        mock_inference_class,
+        mock_loader_class,
+        qwen3_config,
+        sample_profile,
+        tmp_path,
+    ):
+        """Test that inference errors surface as GenerationException."""
+        # Setup mocks
+        mock_loader = Mock()
+        mock_loader.load_model.return_value = True
+        mock_loader_class.return_value = mock_loader
+
+        mock_inference = Mock()
+        mock_inference.generate_batch_to_files.side_effect = RuntimeError("OOM")
+        mock_inference_class.return_value = mock_inference
+
+        adapter = Qwen3Adapter(qwen3_config)
+
+        with pytest.raises(GenerationException, match="OOM"):
+            adapter.generate_batch(
+                texts=["First text"],
+                profile=sample_profile,
+                output_paths=[tmp_path / "seg1.wav"],
+            )
+
     @patch("infra.engines.qwen3.adapter.Qwen3ModelLoader")
     def test_unload_model(self, mock_loader_class, qwen3_config):
         """Test unloading the model."""
@@ -354,13 +425,14 @@ class TestQwen3Adapter:
 
         # Load model first
         adapter._loaded = True
-        adapter.inference = Mock()
+        adapter.inference = mock_inference = Mock()
 
         # Unload
         adapter.unload_model()
 
         assert adapter._loaded is False
         assert adapter.inference is None
+        mock_inference.clear_prompt_cache.assert_called_once()
         mock_loader.unload_model.assert_called_once()
 
     def test_is_loaded_initially_false(self, qwen3_config):
@@ -0,0 +1,290 @@
+"""Tests for Qwen3 CloneMode and Qwen3Inference.
+
+The Qwen3-TTS model is mocked, so no weights are loaded.
+"""
+
+import gc
+import os
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from infra.engines.qwen3.inference import Qwen3Inference
+from infra.engines.qwen3.modes import CloneMode
+from infra.engines.qwen3.modes.clone_mode import _PROMPT_CACHE_SIZE
+
+
+@pytest.fixture
+def mock_model():
+    """Create a mock Qwen3-TTS model."""
+    model = Mock()
+    model.create_voice_clone_prompt.return_value = Mock(name="prompt")
+    model.generate_voice_clone.return_value = (np.zeros(1), 24000)
+    return model
+
+
+@pytest.fixture
+def mock_loader(mock_model):
+    """Create a mock model loader holding a loaded model."""
+    loader = Mock()
+    loader.is_loaded.return_value = True
+    loader.get_model.return_value = mock_model
+    return loader
+
+
+@pytest.fixture
+def ref_audio(tmp_path):
+    """Create a reference audio file."""
+    path = tmp_path / "reference.wav"
+    path.write_bytes(b"RIFF")
+    return path
+
+
+@pytest.fixture
+def config():
+    """Create a test generation configuration."""
+    return {"generation": {"language": "Spanish", "max_new_tokens": 512}}
+
+
+class TestCloneModeGenerateBatch:
+    """Test suite for CloneMode.generate_batch."""
+
+    def test_passes_text_and_language_lists(
+        self, mock_loader, mock_model, ref_audio, config
+    ):
+        """Test that all texts go to the model in one call."""
+        wavs = [np.zeros(10), np.ones(20)]
+        mock_model.generate_voice_clone.return_value = (wavs, 24000)
+        clone_mode = CloneMode(mock_loader, config)
+
+        results = clone_mode.generate_batch(
+            ["Hola", "Adiós"], ref_audio, "Texto de referencia"
+        )
+
+        mock_model.generate_voice_clone.assert_called_once()
+        call_kwargs = mock_model.generate_voice_clone.call_args.kwargs
+        assert call_kwargs["text"] == ["Hola", "Adiós"]
+        assert call_kwargs["language"] == ["Spanish", "Spanish"]
+        assert call_kwargs["max_new_tokens"] == 512
+        assert len(results) == 2
+        assert results[0][0] is wavs[0]
+        assert results[1][0] is wavs[1]
+        assert all(sample_rate == 24000 for _, sample_rate in results)
+
+    def test_language_override_applies_to_every_text(
+        self, mock_loader, mock_model, ref_audio, config
+    ):
+        """Test that an explicit language is repeated for each text."""
+        mock_model.generate_voice_clone.return_value = ([np.zeros(1)] * 3, 24000)
+        clone_mode = CloneMode(mock_loader, config)
+
+        clone_mode.generate_batch(["a", "b", "c"], ref_audio, "ref", language="English")
+
+        call_kwargs = mock_model.generate_voice_clone.call_args.kwargs
+        assert call_kwargs["language"] == ["English"] * 3
+
+    def test_reference_is_encoded_once(
+        self, mock_loader, mock_model, ref_audio, config
+    ):
+        """Test that the reference prompt is created once for the batch."""
+        mock_model.generate_voice_clone.return_value = ([np.zeros(1)] * 2, 24000)
+        clone_mode = CloneMode(mock_loader, config)
+
+        clone_mode.generate_batch(["a", "b"], ref_audio, "ref")
+
+        mock_model.create_voice_clone_prompt.assert_called_once_with(
+            ref_audio=str(ref_audio), ref_text="ref"
+        )
+
+    def test_empty_batch_skips_model(self, mock_loader, mock_model, ref_audio, config):
+        """Test that an empty text list does not call the model."""
+        clone_mode = CloneMode(mock_loader, config)
+
+        assert clone_mode.generate_batch([], ref_audio, "ref") == []
+        mock_model.generate_voice_clone.assert_not_called()
+
+    def test_model_not_loaded_raises(self, mock_loader, ref_audio, config):
+        """Test that generating without a loaded model fails."""
+        mock_loader.is_loaded.return_value = False
+        clone_mode = CloneMode(mock_loader, config)
+
+        with pytest.raises(RuntimeError, match="Model not loaded"):
+            clone_mode.generate_batch(["a"], ref_audio, "ref")
+
+    def test_model_errors_are_wrapped(self, mock_loader, mock_model, ref_audio, config):
+        """Test that model failures surface as RuntimeError."""
+        mock_model.generate_voice_clone.side_effect = ValueError("CUDA OOM")
+        clone_mode = CloneMode(mock_loader, config)
+
+        with pytest.raises(RuntimeError, match="CUDA OOM"):
+            clone_mode.generate_batch(["a"], ref_audio, "ref")
+
+
+class TestCloneModePromptCache:
+    """Test suite for the CloneMode reference prompt cache."""
+
+    def test_same_reference_is_encoded_once(
+        self, mock_loader, mock_model, ref_audio, config
+    ):
+        """Test that an unchanged reference hits the cache."""
+        clone_mode = CloneMode(mock_loader, config)
+
+        clone_mode.generate("Hola", ref_audio, "ref")
+        clone_mode.generate("Adiós", ref_audio, "ref")
+
+        mock_model.create_voice_clone_prompt.assert_called_once()
+
+    def test_edited_reference_is_encoded_again(
+        self, mock_loader, mock_model, ref_audio, config
+    ):
+        """Test that a new mtime on the reference misses the cache."""
+        clone_mode = CloneMode(mock_loader, config)
+
+        clone_mode.generate("Hola", ref_audio, "ref")
+        stat = ref_audio.stat()
+        os.utime(ref_audio, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        clone_mode.generate("Hola", ref_audio, "ref")
+
+        assert mock_model.create_voice_clone_prompt.call_count == 2
+
+    def test_different_transcript_is_encoded_again(
+        self, mock_loader, mock_model, ref_audio, config
+    ):
+        """Test that the transcript is part of the cache key."""
+        clone_mode = CloneMode(mock_loader, config)
+
+        clone_mode.generate("Hola", ref_audio, "first")
+        clone_mode.generate("Hola", ref_audio, "second")
+
+        assert mock_model.create_voice_clone_prompt.call_count == 2
+
+    def test_oldest_entry_is_evicted_first(
+        self, mock_loader, mock_model, tmp_path, config
+    ):
+        """Test FIFO eviction once the cache is full."""
+        clone_mode = CloneMode(mock_loader, config)
+        refs = []
+        for i in range(_PROMPT_CACHE_SIZE + 1):
+            ref = tmp_path / f"ref{i}.wav"
+            ref.write_bytes(b"RIFF")
+            refs.append(ref)
+            clone_mode.generate("Hola", ref, "ref")
+
+        assert len(clone_mode._prompt_cache) == _PROMPT_CACHE_SIZE
+
+        # The newest entries are still cached, the first one was evicted
+        clone_mode.generate("Hola", refs[-1], "ref")
+        assert mock_model.create_voice_clone_prompt.call_count == len(refs)
+        clone_mode.generate("Hola", refs[0], "ref")
+        assert mock_model.create_voice_clone_prompt.call_count == len(refs) + 1
+
+    def test_cache_is_dropped_when_model_changes(self, ref_audio, config):
+        """Test that prompts from an unloaded model are not reused."""
+
+        class Model:
+            def __init__(self):
+                self.prompts = 0
+
+            def create_voice_clone_prompt(self, ref_audio, ref_text):
+                self.prompts += 1
+                return object()
+
+            def generate_voice_clone(self, **kwargs):
+                return np.zeros(1), 24000
+
+        loader = Mock()
+        loader.is_loaded.return_value = True
+        loader.get_model.side_effect = lambda: model
+        clone_mode = CloneMode(loader, config)
+
+        model = Model()
+        clone_mode.generate("Hola", ref_audio, "ref")
+
+        # Reload: the old model is released and a new one takes its place
+        model = Model()
+        gc.collect()
+        assert clone_mode._prompt_model is not None
+        assert clone_mode._prompt_model() is None
+
+        clone_mode.generate("Hola", ref_audio, "ref")
+
+        assert model.prompts == 1
+        assert len(clone_mode._prompt_cache) == 1
+
+    def test_clear_prompt_cache(self, mock_loader, mock_model, ref_audio, config):
+        """Test that clearing the cache forces the prompt to be encoded."""
+        clone_mode = CloneMode(mock_loader, config)
+        clone_mode.generate("Hola", ref_audio, "ref")
+
+        clone_mode.clear_prompt_cache()
+
+        assert clone_mode._prompt_cache == {}
+        clone_mode.generate("Hola", ref_audio, "ref")
+        assert mock_model.create_voice_clone_prompt.call_count == 2
+
+    def test_inference_clear_prompt_cache(
+        self, mock_loader, mock_model, ref_audio, config
+    ):
+        """Test that Qwen3Inference clears its clone mode cache."""
+        inference = Qwen3Inference(mock_loader, config)
+        inference.generate("Hola", ref_audio, "ref")
+
+        inference.clear_prompt_cache()
+
+        assert inference.clone_mode._prompt_cache == {}
+
+
+class TestQwen3InferenceGenerateBatch:
+    """Test suite for Qwen3Inference batch generation."""
+
+    def test_generate_batch_delegates_to_clone_mode(
+        self, mock_loader, mock_model, ref_audio, config
+    ):
+        """Test that one output is returned per text."""
+        mock_model.generate_voice_clone.return_value = ([np.zeros(1)] * 2, 24000)
+        inference = Qwen3Inference(mock_loader, config)
+
+        results = inference.generate_batch(["a", "b"], ref_audio, "ref")
+
+        assert len(results) == 2
+        mock_model.generate_voice_clone.assert_called_once()
+
+    def test_generate_batch_propagates_errors(
+        self, mock_loader, mock_model, ref_audio, config
+    ):
+        """Test that model failures propagate as RuntimeError."""
+        mock_model.generate_voice_clone.side_effect = ValueError("CUDA OOM")
+        inference = Qwen3Inference(mock_loader, config)
+
+        with pytest.raises(RuntimeError, match="CUDA OOM"):
+            inference.generate_batch(["a", "b"], ref_audio, "ref")
+
+    def test_generate_batch_to_files_writes_each_output(
+        self, mock_loader, mock_model, ref_audio, config, tmp_path
+    ):
+        """Test that each generated clip is saved to its own path."""
+        mock_model.generate_voice_clone.return_value = (
+            [np.zeros(100, dtype=np.float32), np.zeros(200, dtype=np.float32)],
+            24000,
+        )
+        inference = Qwen3Inference(mock_loader, config)
+        output_paths = [tmp_path / "out" / "seg1.wav", tmp_path / "out" / "seg2.wav"]
+
+        success = inference.generate_batch_to_files(
+            ["a", "b"], ref_audio, "ref", output_paths
+        )
+
+        assert success is True
+        assert all(path.exists() for path in output_paths)
+
+    def test_generate_batch_to_files_requires_one_path_per_text(
+        self, mock_loader, ref_audio, config, tmp_path
+    ):
+        """Test that mismatched texts and output paths are rejected."""
+        inference = Qwen3Inference(mock_loader, config)
+
+        with pytest.raises(ValueError, match="one output path per text"):
+            inference.generate_batch_to_files(
+                ["a", "b"], ref_audio, "ref", [tmp_path / "seg1.wav"]
+            )
@@ -0,0 +1,56 @@
+"""Tests for DictConfigProvider.
+
+Tests dotted-key access and memoized lookups.
+"""
+
+import pytest
+
+from infra.config.dict_config import DictConfigProvider
+
+
+@pytest.fixture
+def config():
+    """Create a dict config provider with nested values."""
+    return DictConfigProvider(
+        {"model": {"name": "base", "device": "cpu"}, "audio": {"sample_rate": 12000}}
+    )
+
+
+class TestDictConfigProvider:
+    """Test DictConfigProvider lookups."""
+
+    def test_get_nested_values(self, config):
+        """Test dotted-key access and defaults."""
+        assert config.get("model.name") == "base"
+        assert config.get("audio.sample_rate") == 12000
+        assert config.get("missing.key", "fallback") == "fallback"
+        assert config.get("model.name.deeper", "fallback") == "fallback"
+
+    def test_has_uses_same_resolution_as_get(self, config):
+        """Test that has() agrees with get() for present and missing keys."""
+        assert config.has("model.name")
+        assert config.has("model")
+        assert not config.has("model.missing")
+        assert not config.has("model.name.deeper")
+
+    def test_set_invalidates_cached_lookups(self, config):
+        """Test that set() is visible to previously cached keys."""
+        assert config.get("model.device") == "cpu"
+        assert config.get("model.precision") is None
+        assert config.get("model") == {"name": "base", "device": "cpu"}
+
+        config.set("model.device", "cuda")
+        config.set("model.precision", "fp16")
+
+        assert config.get("model.device") == "cuda"
+        assert config.get("model.precision") == "fp16"
+        assert config.has("model.precision")
+
+    def test_set_replacing_subtree_invalidates_children(self, config):
+        """Test that replacing a parent key drops cached child lookups."""
+        assert config.get("model.name") == "base"
+
+        config.set("model", {"name": "replaced"})
+
+        assert config.get("model.name") == "replaced"
+        assert not config.has("model.device")
@@ -0,0 +1,71 @@
+"""Tests for EnvConfigProvider.
+
+Tests environment variable mapping and memoized lookups.
+"""
+
+import pytest
+
+from infra.config.env_config import EnvConfigProvider
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """Set TTS_ environment variables for a provider to read."""
+    monkeypatch.setenv("TTS_MODEL_DEVICE", "cpu")
+    monkeypatch.setenv("TTS_AUDIO_RATE", "12000")
+    return monkeypatch
+
+
+class TestEnvConfigProvider:
+    """Test EnvConfigProvider lookups."""
+
+    def test_get_nested_values(self, env):
+        """Test dotted-key access, type conversion and defaults."""
+        config = EnvConfigProvider()
+
+        assert config.get("model.device") == "cpu"
+        assert config.get("audio.rate") == 12000
+        assert config.get("missing.key", "fallback") == "fallback"
+        assert config.get("model.device.deeper", "fallback") == "fallback"
+
+    def test_reload_invalidates_cached_lookups(self, env):
+        """Test that reload() picks up changed variables for cached keys."""
+        config = EnvConfigProvider()
+        assert config.get("model.device") == "cpu"
+        assert config.get("model.precision") is None
+
+        env.setenv("TTS_MODEL_DEVICE", "mps")
+        env.setenv("TTS_MODEL_PRECISION", "fp16")
+        config.reload()
+
+        assert config.get("model.device") == "mps"
+        assert config.get("model.precision") == "fp16"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("yes", True),
+        ("Off", False),
+        ("42", 42),
+        ("0.7", 0.7),
+        ("1e3", 1000.0),
+        ("mps", "mps"),
+        ("Qwen/Qwen3-TTS", "Qwen/Qwen3-TTS"),
+        ("", ""),
+    ],
+)
+def test_convert_type(raw, expected):
+    """Test conversion of raw environment values."""
+    value = EnvConfigProvider()._convert_type(raw)
+
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+def test_convert_type_float_words():
+    """Test that float spellings starting with a letter still convert."""
+    provider = EnvConfigProvider()
+
+    assert provider._convert_type("Infinity") == float("inf")
+    assert provider._convert_type("nan") != provider._convert_type("nan")
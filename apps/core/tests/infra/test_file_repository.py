@@ -209,3 +209,100 @@ class TestFileProfileRepository:
         assert loaded_sample.channels == original_sample.channels
         assert loaded_sample.bit_depth == original_sample.bit_depth
         assert loaded_sample.emotion == original_sample.emotion
+
+    def test_corrupt_profile_file_is_ignored(self, temp_profiles_dir, sample_profile):
+        """Test that unparseable JSON is skipped by lookups and listings."""
+        repo = FileProfileRepository(temp_profiles_dir)
+        repo.save(sample_profile)
+        (temp_profiles_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+        assert repo.find_by_id("broken") is None
+        assert [p.id for p in repo.list_all()] == [sample_profile.id]
+
+
+class TestFileProfileRepositoryCache:
+    """Test the in-memory cache behind find_by_id."""
+
+    def test_repeated_lookup_skips_deserialization(
+        self, temp_profiles_dir, sample_profile, monkeypatch
+    ):
+        """Test that an unchanged profile file is only deserialized once."""
+        repo = FileProfileRepository(temp_profiles_dir)
+        repo.save(sample_profile)
+
+        from infra.persistence import file_profile_repository
+
+        calls = []
+        original = file_profile_repository.JSONSerializer.deserialize
+        monkeypatch.setattr(
+            file_profile_repository.JSONSerializer,
+            "deserialize",
+            lambda data: calls.append(data) or original(data),
+        )
+
+        first = repo.find_by_id(sample_profile.id)
+        second = repo.find_by_id(sample_profile.id)
+
+        assert len(calls) == 1
+        assert first is not second
+        assert first.name == second.name
+
+    def test_returned_profile_mutation_does_not_leak(
+        self, temp_profiles_dir, sample_profile, sample_audio_sample
+    ):
+        """Test that mutating a returned profile leaves the cache intact."""
+        repo = FileProfileRepository(temp_profiles_dir)
+        repo.save(sample_profile)
+
+        profile = repo.find_by_id(sample_profile.id)
+        profile.samples.append(sample_audio_sample)
+
+        assert len(repo.find_by_id(sample_profile.id).samples) == 1
+
+    def test_external_edit_invalidates_cache(self, temp_profiles_dir, sample_profile):
+        """Test that editing the JSON file is picked up."""
+        repo = FileProfileRepository(temp_profiles_dir)
+        repo.save(sample_profile)
+        repo.find_by_id(sample_profile.id)
+
+        profile_file = temp_profiles_dir / f"{sample_profile.id}.json"
+        data = json.loads(profile_file.read_text())
+        data["name"] = "renamed externally"
+        profile_file.write_text(json.dumps(data))
+
+        assert repo.find_by_id(sample_profile.id).name == "renamed externally"
+
+    def test_save_and_delete_invalidate_cache(self, temp_profiles_dir, sample_profile):
+        """Test that save() and delete() drop cached profiles."""
+        repo = FileProfileRepository(temp_profiles_dir)
+        repo.save(sample_profile)
+        repo.find_by_id(sample_profile.id)
+
+        sample_profile.name = "renamed"
+        repo.save(sample_profile)
+        assert repo.find_by_id(sample_profile.id).name == "renamed"
+
+        repo.delete(sample_profile.id)
+        assert repo.find_by_id(sample_profile.id) is None
+
+    def test_list_all_reuses_cached_profiles(
+        self, temp_profiles_dir, sample_profile, monkeypatch
+    ):
+        """Test that repeated listings only parse changed files."""
+        repo = FileProfileRepository(temp_profiles_dir)
+        repo.save(sample_profile)
+        repo.list_all()
+
+        from infra.persistence import file_profile_repository
+
+        calls = []
+        original = file_profile_repository.JSONSerializer.deserialize
+        monkeypatch.setattr(
+            file_profile_repository.JSONSerializer,
+            "deserialize",
+            lambda data: calls.append(data) or original(data),
+        )
+
+        assert [p.id for p in repo.list_all()] == [sample_profile.id]
+        assert repo.find_by_id(sample_profile.id) is not None
+        assert calls == []
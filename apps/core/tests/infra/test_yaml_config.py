@@ -0,0 +1,172 @@
+"""Tests for YAMLConfigProvider.
+
+Tests loading, merging, and the on-disk parse cache.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from infra.config.yaml_config import YAMLConfigProvider
+
+
+@pytest.fixture
+def default_config(tmp_path):
+    """Create a default config file."""
+    path = tmp_path / "default.yaml"
+    path.write_text(
+        "model:\n  name: base\n  device: cpu\naudio:\n  sample_rate: 12000\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def user_config(tmp_path):
+    """Create a user config file with overrides."""
+    path = tmp_path / "config.yaml"
+    path.write_text("model:\n  device: mps\n", encoding="utf-8")
+    return path
+
+
+class TestYAMLConfigProvider:
+    """Test YAMLConfigProvider loading and lookups."""
+
+    def test_loads_default_config(self, default_config):
+        """Test that default config values are available."""
+        config = YAMLConfigProvider(default_config)
+
+        assert config.get("model.name") == "base"
+        assert config.get("audio.sample_rate") == 12000
+        assert config.get("missing.key", "fallback") == "fallback"
+
+    def test_user_config_overrides_defaults(self, default_config, user_config):
+        """Test that user config is merged over defaults."""
+        config = YAMLConfigProvider(default_config, user_config)
+
+        assert config.get("model.device") == "mps"
+        assert config.get("model.name") == "base"
+
+    def test_missing_default_config_raises(self, tmp_path):
+        """Test that a missing default config raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            YAMLConfigProvider(tmp_path / "missing.yaml")
+
+
+class TestYAMLConfigCache:
+    """Test the in-process parse cache."""
+
+    def test_config_dir_is_left_untouched(self, default_config):
+        """Test that loading writes no cache files next to the YAML file."""
+        YAMLConfigProvider(default_config)
+
+        assert [p.name for p in default_config.parent.iterdir()] == ["default.yaml"]
+
+    def test_cache_disabled(self, default_config):
+        """Test that every load parses the file when caching is disabled."""
+        YAMLConfigProvider(default_config, use_cache=False)
+
+        with patch.object(
+            YAMLConfigProvider, "_parse_yaml", return_value={}
+        ) as mock_parse:
+            YAMLConfigProvider(default_config, use_cache=False)
+
+        mock_parse.assert_called_once_with(default_config)
+
+    def test_cache_is_invalidated_on_edit(self, default_config):
+        """Test that editing the YAML file invalidates the cache."""
+        YAMLConfigProvider(default_config)
+
+        default_config.write_text("model:\n  name: edited\n", encoding="utf-8")
+        stat = default_config.stat()
+        os.utime(default_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        config = YAMLConfigProvider(default_config)
+        assert config.get("model.name") == "edited"
+
+    def test_unchanged_file_is_not_read_again(self, default_config):
+        """Test that loading an unchanged file again is served from memory."""
+        YAMLConfigProvider(default_config)
+
+        with patch.object(YAMLConfigProvider, "_parse_yaml") as mock_parse:
+            config = YAMLConfigProvider(default_config)
+
+        mock_parse.assert_not_called()
+        assert config.get("model.name") == "base"
+
+    def test_providers_do_not_share_config_dicts(self, default_config):
+        """Test that mutating one provider does not leak into another."""
+        first = YAMLConfigProvider(default_config)
+        second = YAMLConfigProvider(default_config)
+
+        first.set("model.device", "cuda")
+        first.reload()
+
+        assert second.get("model.device") == "cpu"
+        assert first.get("model.device") == "cpu"
+
+    def test_reload_skips_unchanged_files(self, default_config, user_config):
+        """Test that reload() keeps the config when no file changed."""
+        config = YAMLConfigProvider(default_config, user_config)
+
+        with patch.object(YAMLConfigProvider, "_load_yaml") as mock_load:
+            config.reload()
+
+        mock_load.assert_not_called()
+        assert config.get("model.device") == "mps"
+
+    def test_reload_after_set_restores_file_values(self, default_config):
+        """Test that runtime values are dropped by reload()."""
+        config = YAMLConfigProvider(default_config)
+        config.set("model.device", "cuda")
+
+        config.reload()
+
+        assert config.get("model.device") == "cpu"
+
+    def test_reload_picks_up_new_user_config(self, default_config, tmp_path):
+        """Test that a user config created after startup is merged."""
+        user_path = tmp_path / "late.yaml"
+        config = YAMLConfigProvider(default_config, user_path)
+        assert config.get("model.device") == "cpu"
+
+        user_path.write_text("model:\n  device: mps\n", encoding="utf-8")
+        config.reload()
+
+        assert config.get("model.device") == "mps"
+
+
+class TestYAMLConfigLookupCache:
+    """Test memoized dotted-key lookups."""
+
+    def test_has_uses_same_resolution_as_get(self, default_config):
+        """Test that has() agrees with get() for present and missing keys."""
+        config = YAMLConfigProvider(default_config)
+
+        assert config.has("model.name")
+        assert config.has("model")
+        assert not config.has("model.missing")
+        assert not config.has("model.name.deeper")
+
+    def test_set_invalidates_cached_lookups(self, default_config):
+        """Test that set() is visible to previously cached keys."""
+        config = YAMLConfigProvider(default_config)
+        assert config.get("model.device") == "cpu"
+        assert config.get("model.precision") is None
+
+        config.set("model.device", "cuda")
+        config.set("model.precision", "fp16")
+
+        assert config.get("model.device") == "cuda"
+        assert config.get("model.precision") == "fp16"
+
+    def test_reload_invalidates_cached_lookups(self, default_config):
+        """Test that reload() drops cached values."""
+        config = YAMLConfigProvider(default_config, use_cache=False)
+        assert config.get("model.name") == "base"
+
+        default_config.write_text("model:\n  name: reloaded\n", encoding="utf-8")
+        config.reload()
+
+        assert config.get("model.name") == "reloaded"